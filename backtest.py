@@ -0,0 +1,224 @@
+# backtest.py
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from game_log_store import GameLogStore, DEFAULT_DB_PATH
+from prop_model import american_odds_arrays
+from prop_scoring import PropScoringEngine, EDGE_THRESHOLDS
+from report_store import ParquetReportBackend, DEFAULT_REPORT_DIR
+
+# Box-score column that settles each prop market
+PROP_OUTCOME_COLUMNS = {
+    'Points': 'pts',
+    'Rebounds': 'reb',
+    'Assists': 'ast',
+    'Steals': 'stl',
+    'Blocks': 'blk',
+}
+
+SNAPSHOT_KEY = ['date', 'player_name', 'prop_type', 'sportsbook']
+CALIBRATION_BINS = np.linspace(0.0, 1.0, 11)
+
+
+def load_outcomes(game_log_store, start=None, end=None):
+    """Per-game box scores for the backtest window"""
+    query = 'SELECT player_name, game_date, pts, reb, ast, stl, blk FROM game_logs WHERE 1 = 1'
+    params = []
+    if start is not None:
+        query += ' AND game_date >= ?'
+        params.append(str(start))
+    if end is not None:
+        query += ' AND game_date <= ?'
+        params.append(str(end))
+    outcomes = pd.read_sql_query(query, game_log_store.conn, params=params)
+    outcomes['date'] = pd.to_datetime(outcomes.pop('game_date')).dt.date
+    return outcomes
+
+
+def settle(props, outcomes):
+    """Attach the actual stat to each prop and settle the over; pushes and no-shows drop out"""
+    # One snapshot per line per day: the last one taken before the game
+    props = props.sort_values('run_at').drop_duplicates(SNAPSHOT_KEY, keep='last')
+    settled = props.merge(outcomes, on=['player_name', 'date'], how='inner')
+
+    actual = np.full(len(settled), np.nan)
+    prop_type = settled['prop_type'].to_numpy()
+    for market, column in PROP_OUTCOME_COLUMNS.items():
+        rows = prop_type == market
+        actual[rows] = settled[column].to_numpy(dtype=float)[rows]
+
+    line = settled['prop_line'].to_numpy(dtype=float)
+    _, implied, payout = american_odds_arrays(settled['odds'])
+    settled = settled.assign(actual=actual, over_hit=actual > line, implied_prob=implied, payout=payout)
+    keep = ~np.isnan(actual) & (actual != line) & ~np.isnan(payout)
+    return settled[keep].reset_index(drop=True)
+
+
+def profit(frame):
+    """Units won per 1-unit over bet"""
+    return np.where(frame['over_hit'], frame['payout'], -1.0)
+
+
+def label_summary(settled, label):
+    """Hit rate and ROI of betting the over on every row, grouped by label, market and book"""
+    frame = settled.assign(profit=profit(settled))
+    grouped = frame.groupby([label, 'prop_type', 'sportsbook'], observed=True)
+    summary = grouped.agg(bets=('profit', 'size'), hit_rate=('over_hit', 'mean'), units=('profit', 'sum'))
+    summary['roi'] = summary['units'] / summary['bets']
+    return summary.reset_index().rename(columns={label: 'label'}).assign(rule=label)
+
+
+def calibration(settled):
+    """Model over_prob against observed hit frequency, by market and book"""
+    frame = settled.dropna(subset=['over_prob'])
+    frame = frame.assign(bucket=pd.cut(frame['over_prob'], CALIBRATION_BINS, include_lowest=True),
+                         sq_error=(frame['over_prob'] - frame['over_hit']) ** 2)
+    grouped = frame.groupby(['prop_type', 'sportsbook', 'bucket'], observed=True)
+    table = grouped.agg(bets=('over_hit', 'size'), predicted=('over_prob', 'mean'),
+                        observed=('over_hit', 'mean'), brier=('sq_error', 'mean'))
+    return table.reset_index()
+
+
+def threshold_grid(strong_buy_values, consider_values):
+    """Threshold tables to sweep: today's table first, then every uniform (strong, consider) pair"""
+    grid = [EDGE_THRESHOLDS]
+    for strong_buy, consider in itertools.product(strong_buy_values, consider_values):
+        if consider < strong_buy:
+            grid.append(pd.DataFrame({'strong_buy': strong_buy, 'consider': consider},
+                                     index=EDGE_THRESHOLDS.index))
+    return grid
+
+
+def sweep_shard(shard, grid):
+    """Bets, hits and units for every threshold table on one date shard"""
+    engine = PropScoringEngine()
+    codes = engine.prop_codes(shard['prop_type'])
+    raw_edge = engine.edges(engine.average_stats(shard, codes), shard['prop_line'])
+    hits = shard['over_hit'].to_numpy()
+    units = profit(shard)
+
+    totals = np.zeros((len(grid), 6))
+    for i, thresholds in enumerate(grid):
+        engine.thresholds = thresholds
+        strong = raw_edge > engine.row_thresholds('strong_buy', codes)
+        consider = ~strong & (raw_edge > engine.row_thresholds('consider', codes))
+        totals[i] = [strong.sum(), hits[strong].sum(), units[strong].sum(),
+                     consider.sum(), hits[consider].sum(), units[consider].sum()]
+    return totals
+
+
+def date_shards(settled, n_shards):
+    dates = np.array(sorted(settled['date'].unique()))
+    for chunk in np.array_split(dates, min(n_shards, len(dates))):
+        yield settled[settled['date'].isin(set(chunk))]
+
+
+def sweep(settled, grid, workers=None):
+    """Evaluate every threshold table across date shards in a process pool"""
+    workers = workers or os.cpu_count() or 1
+    columns = ['strong_bets', 'strong_hits', 'strong_units', 'consider_bets', 'consider_hits', 'consider_units']
+    totals = np.zeros((len(grid), len(columns)))
+    if settled.empty:
+        return pd.DataFrame(totals, columns=columns)
+
+    # Ship workers only what scoring and settlement need
+    needed = ['date', 'prop_type', 'prop_line', 'over_hit', 'payout']
+    needed += [column for column in PropScoringEngine().stat_columns.values() if column in settled]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(sweep_shard, shard, grid)
+                   for shard in date_shards(settled[needed], workers * 4)]
+        for future in futures:
+            totals += future.result()
+
+    result = pd.DataFrame(totals, columns=columns)
+    result.insert(0, 'strong_buy', [describe_thresholds(t, 'strong_buy') for t in grid])
+    result.insert(1, 'consider', [describe_thresholds(t, 'consider') for t in grid])
+    bets = result['strong_bets'] + result['consider_bets']
+    result['bets'] = bets
+    result['hit_rate'] = (result['strong_hits'] + result['consider_hits']) / bets.where(bets > 0)
+    result['roi'] = (result['strong_units'] + result['consider_units']) / bets.where(bets > 0)
+    return result.sort_values('roi', ascending=False, na_position='last').reset_index(drop=True)
+
+
+def describe_thresholds(thresholds, column):
+    values = thresholds[column].unique()
+    return f'{values[0]:g}' if len(values) == 1 else '/'.join(f'{v:g}' for v in thresholds[column])
+
+
+class Backtester:
+    """Replay stored prop snapshots against actual box scores"""
+
+    def __init__(self, report_backend=None, game_log_store=None):
+        self.report_backend = report_backend or ParquetReportBackend()
+        self.game_log_store = game_log_store or GameLogStore()
+        self.engine = PropScoringEngine()
+
+    def settled_props(self, start=None, end=None):
+        props = self.report_backend.load(start, end, with_stats=True)
+        if props.empty:
+            return props
+        settled = settle(props, load_outcomes(self.game_log_store, start, end))
+        # Re-score with today's rules so old snapshots are judged by the current labels
+        rescored = self.engine.score(settled.drop(columns=['avg_stat', 'edge', 'rating', 'recommendation'],
+                                                  errors='ignore'))
+        rescored['rating'] = rescored['rating'].replace('', 'NONE')
+        return rescored
+
+    def run(self, start=None, end=None, grid=None, workers=None):
+        print("🧪 Backtesting stored props against box scores...")
+        started = time.perf_counter()
+        settled = self.settled_props(start, end)
+        print(f"✅ Settled {len(settled)} props over {settled['date'].nunique() if len(settled) else 0} days")
+        if settled.empty:
+            return {}
+
+        results = {
+            'labels': pd.concat([label_summary(settled, 'rating'), label_summary(settled, 'recommendation')],
+                                ignore_index=True),
+        }
+        if 'over_prob' in settled:
+            results['calibration'] = calibration(settled)
+        if grid is not None:
+            print(f"🔬 Sweeping {len(grid)} threshold tables on {workers or os.cpu_count()} workers...")
+            results['sweep'] = sweep(settled, grid, workers)
+        print(f"⏱️ Backtest finished in {time.perf_counter() - started:.1f}s")
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtest prop recommendations against actual outcomes')
+    parser.add_argument('--start', help='first snapshot date (YYYY-MM-DD)')
+    parser.add_argument('--end', help='last snapshot date (YYYY-MM-DD)')
+    parser.add_argument('--report-dir', default=DEFAULT_REPORT_DIR)
+    parser.add_argument('--game-log-db', default=DEFAULT_DB_PATH)
+    parser.add_argument('--sweep', action='store_true', help='also sweep a grid of edge thresholds')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    grid = None
+    if args.sweep:
+        grid = threshold_grid(np.round(np.arange(0.5, 4.01, 0.25), 2), np.round(np.arange(0.0, 2.01, 0.1), 2))
+
+    backtester = Backtester(ParquetReportBackend(args.report_dir), GameLogStore(args.game_log_db))
+    results = backtester.run(args.start, args.end, grid=grid, workers=args.workers)
+
+    with pd.option_context('display.width', 140, 'display.max_rows', 60):
+        if 'labels' in results:
+            print("\n📊 Hit rate and ROI (over bets) by label:")
+            print(results['labels'].to_string(index=False, float_format='{:.3f}'.format))
+        if 'calibration' in results:
+            print("\n🎯 Calibration of over_prob:")
+            print(results['calibration'].to_string(index=False, float_format='{:.3f}'.format))
+        if 'sweep' in results:
+            print("\n🔬 Best threshold tables:")
+            print(results['sweep'].head(15).to_string(index=False, float_format='{:.3f}'.format))
+
+
+if __name__ == "__main__":
+    main()
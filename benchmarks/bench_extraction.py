@@ -0,0 +1,121 @@
+# benchmarks/bench_extraction.py
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from prop_extractor import PropPageExtractor
+
+FIXTURE_DIR = os.path.join(ROOT, 'benchmarks', 'fixtures')
+FIRST_NAMES = ['Stephen', 'Luka', 'Nikola', 'Kevin', 'Jayson', 'Anthony', 'Jimmy', 'Paul', 'Kawhi', 'Ja']
+LAST_NAMES = ['Curry', 'Doncic', 'Jokic', 'Durant', 'Tatum', 'Davis', 'Butler', 'George', 'Leonard', 'Morant']
+
+
+def make_prop_page(n_rows, seed=11):
+    """A props page shaped like the real one: markup-heavy rows plus Next.js state"""
+    rng = np.random.default_rng(seed)
+    rows, state = [], []
+    for i in range(n_rows):
+        name = f'{FIRST_NAMES[rng.integers(10)]} {LAST_NAMES[rng.integers(10)]}'
+        market = ['Points', 'Rebounds', 'Assists'][rng.integers(3)]
+        line = rng.integers(2, 35) + 0.5
+        rows.append(
+            f'<tr class="prop-row" data-row="{i}"><td><div class="player"><a href="/nba/players/{i}">'
+            f'<span class="name">{name}</span></a><span class="team">TEAM</span></div></td>'
+            f'<td class="market">{market}</td><td class="line">{name} OVER {line}</td>'
+            f'<td class="odds"><button>-110</button></td></tr>'
+        )
+        state.append({'player': {'full_name': name, 'id': i}, 'market': market, 'line': line, 'odds': -110})
+    next_data = json.dumps({'props': {'pageProps': {'markets': state}}})
+    return (
+        '<!DOCTYPE html><html><head><title>NBA Props</title>'
+        '<style>.prop-row td { padding: 4px; }</style>'
+        '<script>window.analytics = {"enabled": true};</script></head><body>'
+        f'<nav>{"<a href=#>Link</a>" * 200}</nav><table><tbody>{"".join(rows)}</tbody></table>'
+        f'<script id="__NEXT_DATA__" type="application/json">{next_data}</script>'
+        '</body></html>'
+    ).encode('utf-8')
+
+
+def ensure_fixtures(sizes):
+    """Write synthetic pages once so later runs reuse the same bytes"""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    paths = []
+    for n_rows in sizes:
+        path = os.path.join(FIXTURE_DIR, f'props_{n_rows}.html')
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(make_prop_page(n_rows))
+        paths.append(path)
+    return paths
+
+
+def legacy_extract(content):
+    """The old path: full soup, prettified dump, get_text() and page-wide regexes"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    soup.prettify()
+    soup.find_all('table')
+    soup.find_all(text=re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+'))
+    page_text = soup.get_text()
+    re.findall(r'[A-Z][a-z]+ [A-Z][a-z]+', page_text)
+    re.findall(r'(\w+ \w+) (OVER|UNDER) (\d+\.\d+)', page_text)
+
+
+def streaming_extract(content):
+    PropPageExtractor().extract(content)
+
+
+METHODS = {'legacy': legacy_extract, 'streaming': streaming_extract}
+
+
+def measure(method, path):
+    """Run in a fresh process so peak RSS belongs to this parse alone"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    METHODS[method](content)
+    elapsed = time.perf_counter() - start
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+    # Second pass under tracemalloc, which slows parsing too much to time
+    tracemalloc.start()
+    METHODS[method](content)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, traced_peak / 1e6, rss_growth / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse time and peak memory of prop page extraction')
+    parser.add_argument('fixtures', nargs='*', help='saved HTML pages (default: synthetic fixtures)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000],
+                        help='prop rows per synthetic fixture')
+    args = parser.parse_args()
+
+    paths = args.fixtures or ensure_fixtures(args.sizes)
+
+    context = multiprocessing.get_context('spawn')
+    print(f"{'fixture':<24} {'MB':>6} {'method':<10} {'parse s':>8} {'traced MB':>10} {'rss MB':>8}")
+    for path in paths:
+        size_mb = os.path.getsize(path) / 1e6
+        for method in METHODS:
+            with context.Pool(1) as pool:
+                elapsed, traced_mb, rss_mb = pool.apply(measure, (method, path))
+            print(f"{os.path.basename(path):<24} {size_mb:>6.1f} {method:<10} {elapsed:>8.3f} "
+                  f"{traced_mb:>10.1f} {rss_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_market_index.py
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from market_index import MarketIndex
+
+PROP_TYPES = ['Points', 'Rebounds', 'Assists', 'Three Pointers']
+SPORTSBOOKS = ['DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet']
+
+
+def make_quotes(n_rows, seed=5):
+    """Two-sided quotes: each (player, market, book) carries an over and an under"""
+    rng = np.random.default_rng(seed)
+    n_markets = max(1, n_rows // (2 * len(SPORTSBOOKS)))
+    market = np.repeat(np.arange(n_markets), 2 * len(SPORTSBOOKS))[:n_rows]
+    book = np.tile(np.repeat(SPORTSBOOKS, 2), n_markets)[:n_rows]
+    side = np.tile(['over', 'under'], n_rows // 2 + 1)[:n_rows]
+
+    base_line = rng.integers(2, 30, n_markets) + 0.5
+    line = base_line[market] + rng.choice([-1.0, 0.0, 0.0, 0.0, 1.0], n_rows)
+    odds = rng.choice([-125, -120, -115, -110, -105, 100, 105, 110], n_rows)
+    return pd.DataFrame({
+        'player_name': [f'Player {m // len(PROP_TYPES)}' for m in market],
+        'prop_type': np.array(PROP_TYPES)[market % len(PROP_TYPES)],
+        'sportsbook': book,
+        'side': side,
+        'prop_line': line,
+        'odds': [f'{o:+d}' if o > 0 else str(o) for o in odds],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and incremental-update cost of the market index')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--updates', type=int, default=10_000)
+    args = parser.parse_args()
+
+    quotes = make_quotes(args.rows)
+    start = time.perf_counter()
+    index = MarketIndex(quotes)
+    build_s = time.perf_counter() - start
+    print(f"built index over {len(quotes):,} quotes / {len(index.summary):,} markets in {build_s:.2f}s "
+          f"({len(index.flagged()):,} middles or arbs)")
+
+    rng = np.random.default_rng(9)
+    picks = quotes.iloc[rng.integers(0, len(quotes), args.updates)]
+    moves = rng.choice([-1.0, 1.0], args.updates)
+    start = time.perf_counter()
+    for row, move in zip(picks.itertuples(index=False), moves):
+        index.update(row.player_name, row.prop_type, row.sportsbook, row.prop_line + move, row.odds, row.side)
+    update_s = time.perf_counter() - start
+    print(f"{args.updates:,} single-quote updates in {update_s:.2f}s "
+          f"({update_s / args.updates * 1e6:.0f} µs each)")
+    start = time.perf_counter()
+    flagged = index.flagged()
+    print(f"folded updates into the summary in {time.perf_counter() - start:.2f}s "
+          f"({len(flagged):,} middles or arbs)")
+
+    # Incremental state must match a full rebuild
+    for market in picks[['player_name', 'prop_type']].drop_duplicates().head(200).itertuples(index=False):
+        books = index.market_rows(tuple(market))
+        rebuilt = index.summarize(pd.DataFrame(
+            [(market.player_name, market.prop_type, book, side, line, odds, implied, payout)
+             for (book, side), (line, odds, implied, payout) in books.items()],
+            columns=['player_name', 'prop_type', 'sportsbook', 'side', 'prop_line', 'odds',
+                     'implied_prob', 'payout'],
+        )).iloc[0]
+        current = index.summary.loc[tuple(market)]
+        for column in ['over_line', 'under_line', 'over_prob', 'under_prob', 'fair_over_prob']:
+            assert np.isclose(current[column], rebuilt[column], equal_nan=True), (market, column)
+        assert bool(current['middle']) == bool(rebuilt['middle'])
+        assert bool(current['arbitrage']) == bool(rebuilt['arbitrage'])
+    print("incremental summaries match a rebuild")
+
+
+if __name__ == "__main__":
+    main()
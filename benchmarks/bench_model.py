@@ -0,0 +1,29 @@
+# benchmarks/bench_model.py
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_scoring import make_merged_frame
+from prop_model import PropProbabilityModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time batched re-pricing of a whole slate')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    model = PropProbabilityModel()
+    print(f"{'rows':>10} {'price s':>9} {'rows/s':>12}")
+    for n_rows in args.sizes:
+        merged_df = make_merged_frame(n_rows)
+        start = time.perf_counter()
+        model.price(merged_df)
+        elapsed = time.perf_counter() - start
+        print(f"{n_rows:>10,} {elapsed:>9.3f} {n_rows / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
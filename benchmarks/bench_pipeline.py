@@ -0,0 +1,134 @@
+# benchmarks/bench_pipeline.py
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nba_prop_tool import NBAPropToolFinal
+from pipeline_profiler import PipelineProfiler
+from report_store import ParquetReportBackend
+from stats_cache import StatsCache
+from slate import make_slate, parse_size
+
+DEFAULT_SIZES = ['50x3x3', '300x5x5', '1000x6x8', '3000x6x10']
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_pipeline.json')
+STAGES = ['name_join', 'analyze', 'report', 'export']
+
+
+def make_tool(workdir):
+    """Offline tool whose cache, name memo and reports all live in workdir"""
+    cache = StatsCache(cache_dir=os.path.join(workdir, 'cache'), offline=True)
+    return NBAPropToolFinal(stats_cache=cache, offline=True,
+                            report_backend=ParquetReportBackend(os.path.join(workdir, 'reports')))
+
+
+def run_stages(props_df, stats_df, trace_memory):
+    """One cold pass over the benchmarked stages; a fresh workdir keeps the name memo empty"""
+    workdir = tempfile.mkdtemp(prefix='bench_pipeline_')
+    try:
+        tool = make_tool(workdir)
+        profiler = PipelineProfiler(trace_memory=trace_memory)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with profiler.stage('name_join', rows_in=len(props_df)) as stage:
+                stage.rows_out = len(tool.resolve_player_names(props_df, stats_df))
+            if os.path.exists(tool.name_memo_path):
+                os.remove(tool.name_memo_path)
+            with profiler.stage('analyze', rows_in=len(props_df)) as stage:
+                opportunities, scored_df = tool.analyze_opportunities(props_df, stats_df)
+                stage.rows_out = len(scored_df)
+            with profiler.stage('report', rows_in=len(scored_df)) as stage:
+                tool.generate_report(opportunities, scored_df)
+                stage.rows_out = len(opportunities)
+            with profiler.stage('export', rows_in=len(scored_df)) as stage:
+                stage.rows_out = len(tool.export_results(scored_df, opportunities))
+        return {stage.name: stage for stage in profiler.stages}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def measure(size, repeat, seed):
+    """Best-of-repeat wall time per stage, plus peak memory from a separate traced pass"""
+    props_df, stats_df = make_slate(*parse_size(size), seed=seed)
+    timed = [run_stages(props_df, stats_df, trace_memory=False) for _ in range(repeat)]
+    traced = run_stages(props_df, stats_df, trace_memory=True)
+
+    results = {}
+    for name in STAGES:
+        best = min(run[name].wall_s for run in timed)
+        results[name] = {
+            'rows': len(props_df),
+            'wall_s': round(best, 5),
+            'rows_per_s': round(len(props_df) / best) if best else None,
+            'peak_mb': round(traced[name].peak_bytes / 1e6, 2),
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Stage/size pairs whose wall time or peak memory grew by more than tolerance"""
+    regressions = []
+    for size, stages in results.items():
+        for name, current in stages.items():
+            previous = baseline.get('results', {}).get(size, {}).get(name)
+            if not previous:
+                continue
+            for metric in ('wall_s', 'peak_mb'):
+                # Ignore noise on tiny absolute values
+                floor = 0.005 if metric == 'wall_s' else 1.0
+                if current[metric] > max(previous[metric], floor) * (1 + tolerance):
+                    regressions.append((size, name, metric, previous[metric], current[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline timing and memory of the analysis and export paths')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='slates as PLAYERSxPROP_TYPESxBOOKS, e.g. 300x5x5')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite the baseline with this run')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown or memory growth before a stage counts as a regression')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'slate':>10} {'rows':>8} {'stage':>10} {'wall ms':>9} {'rows/s':>11} {'peak MB':>8}")
+    for size in args.sizes:
+        results[size] = measure(size, args.repeat, args.seed)
+        for name, stage in results[size].items():
+            print(f"{size:>10} {stage['rows']:>8,} {name:>10} {stage['wall_s'] * 1000:>9.1f} "
+                  f"{stage['rows_per_s'] or 0:>11,} {stage['peak_mb']:>8.1f}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'seed': args.seed, 'results': results}, f, indent=2)
+        print(f"saved baseline to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; record one with --save-baseline")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.baseline}")
+        return
+    print(f"{len(regressions)} regressions beyond {args.tolerance:.0%}:")
+    for size, name, metric, before, after in regressions:
+        print(f"   {size} {name} {metric}: {before} -> {after}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_schema.py
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from prop_model import american_odds_arrays
+from prop_schema import StatsTable, compact_props, memory_bytes
+from prop_scoring import PropScoringEngine
+from slate import make_slate, parse_size
+
+DEFAULT_SIZES = ['450x6x10', '3000x6x10', '10000x6x10']
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Object-string merge vs. compact props + keyed stats table')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES,
+                        help='slates as PLAYERSxPROP_TYPESxBOOKS; 450 players is roughly a full league')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    engine = PropScoringEngine()
+    for size in args.sizes:
+        props_df, stats_df = make_slate(*parse_size(size), scraped_names=0.0)
+
+        merge_s, merged_df = best_of(lambda: pd.merge(props_df, stats_df, on='player_name', how='left'), args.repeat)
+        # The merged path still has to price its odds (at least once) before scoring
+        odds_s, _ = best_of(lambda: american_odds_arrays(merged_df['odds']), args.repeat)
+        table = StatsTable(stats_df)
+        compact_s, compact_df = best_of(lambda: compact_props(props_df, table), args.repeat)
+        before = memory_bytes(merged_df)
+        after = memory_bytes(compact_df) + table.values.nbytes + memory_bytes(table.frame)
+
+        codes = engine.prop_codes(props_df['prop_type'])
+        merged_score_s, merged_avg = best_of(lambda: engine.average_stats(merged_df, codes), args.repeat)
+        lookup_s, lookup_avg = best_of(lambda: engine.average_stats(compact_df, codes, table), args.repeat)
+        assert np.allclose(merged_avg, lookup_avg, equal_nan=True, rtol=1e-6)
+
+        print(f"{size} ({len(props_df):,} props, {len(stats_df):,} players)")
+        print(f"   memory: merged {before / 1e6:.1f} MB -> compact props + stats table {after / 1e6:.1f} MB "
+              f"({before / after:.1f}x smaller)")
+        print(f"   join:   merge {merge_s * 1000:.1f} ms (with odds parse {(merge_s + odds_s) * 1000:.1f} ms) | "
+              f"compact load + player ids {compact_s * 1000:.1f} ms (odds parsed once, included)")
+        print(f"   stats:  merged columns {merged_score_s * 1000:.2f} ms | id lookup {lookup_s * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
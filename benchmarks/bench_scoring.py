@@ -0,0 +1,140 @@
+# benchmarks/bench_scoring.py
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prop_scoring import PropScoringEngine
+
+PROP_TYPES = ['Points', 'Rebounds', 'Assists', 'Three Pointers']
+SPORTSBOOKS = ['DraftKings', 'FanDuel', 'BetMGM']
+
+
+def make_merged_frame(n_rows, n_players=500, seed=7):
+    """Random props already joined to per-game stats"""
+    rng = np.random.default_rng(seed)
+    player_ids = rng.integers(0, n_players, n_rows)
+    ppg = rng.uniform(5, 35, n_players)
+    rpg = rng.uniform(1, 13, n_players)
+    apg = rng.uniform(0.5, 10, n_players)
+    prop_type = rng.choice(PROP_TYPES, n_rows)
+
+    base = np.select(
+        [prop_type == 'Points', prop_type == 'Rebounds', prop_type == 'Assists'],
+        [ppg[player_ids], rpg[player_ids], apg[player_ids]],
+        default=2.5,
+    )
+    prop_line = np.floor(base + rng.normal(0, 2, n_rows)) + 0.5
+
+    merged_df = pd.DataFrame({
+        'player_name': [f'Player {i}' for i in player_ids],
+        'prop_type': prop_type,
+        'prop_line': prop_line,
+        'odds': rng.choice(['-110', '-115', '-120', '+100', '+110', '+130'], n_rows),
+        'sportsbook': rng.choice(SPORTSBOOKS, n_rows),
+        'ppg': ppg[player_ids],
+        'rpg': rpg[player_ids],
+        'apg': apg[player_ids],
+    })
+
+    # Leave some players without stats, as the left merge does
+    missing = rng.random(n_rows) < 0.05
+    merged_df.loc[missing, ['ppg', 'rpg', 'apg']] = np.nan
+    return merged_df
+
+
+def legacy_score(merged_df):
+    """The pre-engine iterrows loop plus the two apply(axis=1) export passes"""
+    opportunities = []
+    for _, row in merged_df.iterrows():
+        if pd.isna(row['ppg']):
+            continue
+        if row['prop_type'] == 'Points':
+            edge = row['ppg'] - row['prop_line']
+            if edge > 1.5:
+                opportunities.append(('STRONG BUY', 'Points', row, edge))
+            elif edge > 0.5:
+                opportunities.append(('CONSIDER', 'Points', row, edge))
+        elif row['prop_type'] == 'Rebounds':
+            edge = row['rpg'] - row['prop_line']
+            if edge > 1.2:
+                opportunities.append(('STRONG BUY', 'Rebounds', row, edge))
+            elif edge > 0.3:
+                opportunities.append(('CONSIDER', 'Rebounds', row, edge))
+        elif row['prop_type'] == 'Assists':
+            edge = row['apg'] - row['prop_line']
+            if edge > 1.0:
+                opportunities.append(('STRONG BUY', 'Assists', row, edge))
+            elif edge > 0.2:
+                opportunities.append(('CONSIDER', 'Assists', row, edge))
+
+    def calculate_edge(row):
+        if row['prop_type'] == 'Points' and not pd.isna(row['ppg']):
+            return row['ppg'] - row['prop_line']
+        elif row['prop_type'] == 'Rebounds' and not pd.isna(row['rpg']):
+            return row['rpg'] - row['prop_line']
+        elif row['prop_type'] == 'Assists' and not pd.isna(row['apg']):
+            return row['apg'] - row['prop_line']
+        return 0
+
+    def get_recommendation(row):
+        edge = row['edge']
+        if edge > 1.5:
+            return 'STRONG BUY'
+        elif edge > 0.5:
+            return 'CONSIDER'
+        elif edge < -1.0:
+            return 'AVOID'
+        else:
+            return 'NEUTRAL'
+
+    merged_df = merged_df.copy()
+    merged_df['edge'] = merged_df.apply(calculate_edge, axis=1)
+    merged_df['recommendation'] = merged_df.apply(get_recommendation, axis=1)
+    return opportunities, merged_df
+
+
+def check_agreement(legacy_result, engine_df):
+    """Make sure both paths agree before comparing their speed"""
+    opportunities, legacy_df = legacy_result
+    flagged = engine_df[engine_df['rating'] != '']
+    assert len(opportunities) == len(flagged), 'opportunity counts differ'
+    assert (legacy_df['recommendation'].to_numpy() == engine_df['recommendation'].to_numpy()).all()
+    assert np.allclose(legacy_df['edge'].to_numpy(dtype=float), engine_df['edge'].to_numpy())
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the scoring engine with the legacy row loop')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help='only time the engine for slates larger than this')
+    args = parser.parse_args()
+
+    engine = PropScoringEngine()
+    print(f"{'rows':>10} {'legacy s':>10} {'engine s':>10} {'speedup':>9}")
+    for n_rows in args.sizes:
+        merged_df = make_merged_frame(n_rows)
+        engine_s, engine_df = time_call(engine.score, merged_df)
+
+        if args.skip_legacy_above is not None and n_rows > args.skip_legacy_above:
+            print(f"{n_rows:>10,} {'-':>10} {engine_s:>10.4f} {'-':>9}")
+            continue
+
+        legacy_s, legacy_result = time_call(legacy_score, merged_df)
+        check_agreement(legacy_result, engine_df)
+        print(f"{n_rows:>10,} {legacy_s:>10.3f} {engine_s:>10.4f} {legacy_s / engine_s:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_season_loader.py
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from season_stats import (SeasonStatsLoader, FrameLeagueLeaders, normalize_leaders, PER_GAME_COLUMNS,
+                          REGULAR_SEASON, PLAYOFFS)
+from stats_cache import StatsCache
+
+
+def make_totals(n_players, season_type, seed):
+    """LeagueLeaders-shaped season totals"""
+    rng = np.random.default_rng(seed)
+    games = rng.integers(1, 20 if season_type == PLAYOFFS else 82, n_players)
+    minutes = rng.uniform(10, 38, n_players)
+    totals = {'PLAYER_ID': np.arange(n_players), 'PLAYER': [f'Player {i}' for i in range(n_players)], 'GP': games}
+    for column, per_minute in zip(PER_GAME_COLUMNS, [0.5, 0.2, 0.12, 0.03, 0.02, 1.0]):
+        totals[column] = np.round(games * minutes * per_minute * rng.uniform(0.5, 1.5, n_players))
+    return pd.DataFrame(totals)
+
+
+def legacy_normalize(raw):
+    """The one-column-at-a-time division get_player_stats used (minutes left as season totals)"""
+    stats_df = raw[['PLAYER', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'MIN', 'GP']].copy()
+    stats_df.columns = ['player_name', 'ppg', 'rpg', 'apg', 'spg', 'bpg', 'mpg', 'games_played']
+    for column in ['ppg', 'rpg', 'apg', 'spg', 'bpg']:
+        stats_df[column] = stats_df[column] / stats_df['games_played']
+    return stats_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent multi-season stats loading against a local fake endpoint')
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--players', type=int, default=600)
+    parser.add_argument('--latency', type=float, default=0.25, help='simulated seconds per endpoint call')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    seasons = [f'{year}-{(year + 1) % 100:02d}' for year in range(2024 - args.seasons + 1, 2025)]
+    season_types = (REGULAR_SEASON, PLAYOFFS)
+    frames = {(season, season_type): make_totals(args.players, season_type, seed=i)
+              for i, (season, season_type) in enumerate((s, t) for s in seasons for t in season_types)}
+    combos = len(frames)
+
+    raw = next(iter(frames.values()))
+    vectorized = normalize_leaders(raw)
+    legacy = legacy_normalize(raw)
+    assert np.allclose(vectorized[['ppg', 'rpg', 'apg']], legacy[['ppg', 'rpg', 'apg']])
+    assert np.allclose(vectorized['mpg'], raw['MIN'] / raw['GP'])
+
+    workdir = tempfile.mkdtemp(prefix='bench_seasons_')
+    try:
+        for workers in (1, args.workers):
+            cache_dir = os.path.join(workdir, f'cache_{workers}')
+            endpoint = FrameLeagueLeaders(frames, latency=args.latency)
+            loader = SeasonStatsLoader(StatsCache(cache_dir=cache_dir), endpoint, max_workers=workers)
+            start = time.perf_counter()
+            stats = loader.load(seasons, season_types)
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loader.load(seasons, season_types)
+            warm = time.perf_counter() - start
+            print(f"--> {combos} combinations, {workers} worker(s): cold {cold:.2f}s, warm {warm:.2f}s, "
+                  f"{endpoint.calls} endpoint calls")
+
+        # Mapped parts: opening every season allocates nothing until columns are materialized
+        before = pa.total_allocated_bytes()
+        tables = [stats.table(key) for key in stats.keys()]
+        mapped = pa.total_allocated_bytes() - before
+        frame = stats.frame(columns=['ppg', 'mpg'])
+        print(f"--> mapped {len(tables)} parts with {mapped:,} bytes of Arrow allocations; "
+              f"season-indexed frame {frame.shape} ({frame.memory_usage(deep=True).sum() / 1e6:.1f} MB for 2 columns)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_startup.py
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from report_view import save_snapshot
+
+ENTRY_POINTS = ['report_view', 'prop_cli', 'nba_prop_tool', 'real_prop_scraper', 'season_stats']
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'requests', 'bs4', 'nba_api']
+REPORT_BUDGET_S = 0.5
+
+SAMPLE_REPORT = {
+    'generated_at': '2025-01-15 19:00',
+    'total_props': 8,
+    # Rows in report_view.OPPORTUNITY_FIELDS order
+    'opportunities': [
+        ['Luka Doncic', 'Points', 32.5, 33.5, 1.0, '-125', 'FanDuel', 0.54, 0.56, -0.02, 'CONSIDER'],
+    ],
+    'line_shopping': [],
+}
+
+
+def import_times(module=None):
+    """Cumulative microseconds per imported module, from `python -X importtime`"""
+    code = f'import {module}' if module else 'pass'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time:   self [us] | cumulative | imported package"
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def best_wall_time(command, repeat, **kwargs):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time startup cost of each entry point')
+    parser.add_argument('--modules', nargs='+', default=ENTRY_POINTS)
+    parser.add_argument('--top', type=int, default=5, help='slowest imports to list per entry point')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Whatever a bare interpreter already imports (site, .pth hooks) is not the entry point's cost
+    startup = set(import_times())
+    for module in args.modules:
+        times = import_times(module)
+        heavy = [name for name in HEAVY_MODULES if name in times]
+        print(f"{module}: {times[module] / 1000:.1f} ms to import"
+              f" | heavy: {', '.join(heavy) if heavy else 'none'}")
+        top = sorted(((us, name) for name, us in times.items()
+                      if name != module and name not in startup), reverse=True)[:args.top]
+        for us, name in top:
+            print(f"   {us / 1000:8.1f} ms  {name}")
+
+    baseline_s = best_wall_time([sys.executable, '-c', 'pass'], args.repeat)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        save_snapshot(SAMPLE_REPORT, cache_dir)
+        report_s = best_wall_time([sys.executable, os.path.join(ROOT, 'prop_cli.py'), '--cache-dir', cache_dir,
+                                   'report'], args.repeat, cwd=ROOT)
+    verdict = 'OK' if report_s < REPORT_BUDGET_S else 'OVER BUDGET'
+    print(f"\n`prop_cli.py report` from cache: {report_s * 1000:.0f} ms wall "
+          f"(bare interpreter {baseline_s * 1000:.0f} ms, budget {REPORT_BUDGET_S * 1000:.0f} ms) {verdict}")
+    return 0 if report_s < REPORT_BUDGET_S else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# benchmarks/slate.py
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+PROP_TYPES = ['Points', 'Rebounds', 'Assists', 'Three Pointers', 'Steals', 'Blocks']
+SPORTSBOOKS = ['DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet',
+               'BetRivers', 'ESPN BET', 'Fanatics', 'Hard Rock', 'bet365']
+
+FIRST_NAMES = ['LeBron', 'Stephen', 'Kevin', 'Nikola', 'Luka', 'Giannis', 'Jayson', 'Joel', 'Anthony',
+               'Jimmy', 'Paul', 'Kawhi', 'Ja', 'Devin', 'Damian', 'Trae', 'Tyrese', 'Donovan', 'Jalen',
+               'Shai', 'Karl-Anthony', 'Zion', 'Domantas', 'Bam', 'Jaren', "De'Aaron", 'Kristaps',
+               'Jusuf', 'Bogdan', 'Alperen', 'Victor', 'Cade', 'Scottie', 'Franz', 'Jabari', 'Evan',
+               'Tyler', 'Mikal', 'Herbert', 'Desmond']
+LAST_NAMES = ['James', 'Curry', 'Durant', 'Jokić', 'Dončić', 'Antetokounmpo', 'Tatum', 'Embiid', 'Davis',
+              'Butler', 'George', 'Leonard', 'Morant', 'Booker', 'Lillard', 'Young', 'Haliburton',
+              'Mitchell', 'Brunson', 'Gilgeous-Alexander', 'Towns', 'Williamson', 'Sabonis', 'Adebayo',
+              'Jackson', 'Fox', 'Porziņģis', 'Nurkić', 'Bogdanović', 'Şengün', 'Wembanyama', 'Cunningham',
+              'Barnes', 'Wagner', 'Smith', 'Mobley', 'Herro', 'Bridges', 'Jones', 'Bane', 'Green',
+              "O'Neale", 'Valančiūnas', 'Holiday', 'Murray', 'Porter', 'Ball', 'Hield', 'Vučević', 'Allen']
+SUFFIXES = ['Jr.', 'Sr.', 'II', 'III']
+
+# Per-minute production (mean, sd) for each stat column, loosely matching league spreads
+PER_MINUTE = {
+    'ppg': (0.48, 0.15),
+    'rpg': (0.19, 0.08),
+    'apg': (0.12, 0.07),
+    'spg': (0.030, 0.012),
+    'bpg': (0.020, 0.018),
+}
+PROP_STATS = {'Points': 'ppg', 'Rebounds': 'rpg', 'Assists': 'apg', 'Steals': 'spg', 'Blocks': 'bpg'}
+
+
+def make_players(n_players, rng):
+    """Unique canonical names; some carry accents or suffixes, as the NBA API returns them"""
+    first = rng.choice(FIRST_NAMES, n_players * 2)
+    last = rng.choice(LAST_NAMES, n_players * 2)
+    names, seen = [], set()
+    for i, (given, family) in enumerate(zip(first, last)):
+        name = f'{given} {family}'
+        if name in seen or rng.random() < 0.04:
+            name = f'{name} {SUFFIXES[i % len(SUFFIXES)]}'
+        if name in seen:
+            name = f'{given} {family}-{i}'
+        seen.add(name)
+        names.append(name)
+        if len(names) == n_players:
+            break
+    while len(names) < n_players:
+        names.append(f'Player {len(names)}')
+    return np.array(names, dtype=object)
+
+
+def scraped_name(name, rng):
+    """How a sportsbook page tends to spell a player: accents dropped, suffix sometimes lost"""
+    plain = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    if rng.random() < 0.5:
+        # Only a trailing suffix: replacing ' II' inside ' III' would leave 'Smith' + 'I'
+        for suffix in SUFFIXES:
+            if plain.endswith(f' {suffix}'):
+                plain = plain[:-len(suffix) - 1]
+                break
+    return plain
+
+
+def make_stats(names, rng):
+    """Per-game stats frame shaped like get_player_stats() output"""
+    n_players = len(names)
+    minutes = rng.uniform(12, 38, n_players)
+    stats = {'player_name': names}
+    for column, (mean, sd) in PER_MINUTE.items():
+        stats[column] = np.round(minutes * np.clip(rng.normal(mean, sd, n_players), mean * 0.15, None), 1)
+    stats['mpg'] = np.round(minutes, 1)
+    stats['games_played'] = rng.integers(5, 82, n_players)
+    return pd.DataFrame(stats)
+
+
+def fair_odds(over_prob):
+    """American odds for a probability, rounded to the nearest 5 as books quote them"""
+    american = np.where(over_prob >= 0.5, -100 * over_prob / (1 - over_prob), 100 * (1 - over_prob) / over_prob)
+    american = np.round(american / 5) * 5
+    return np.where(np.abs(american) < 100, -100, american).astype(int)
+
+
+def make_slate(n_players, n_prop_types, n_books, seed=42, scraped_names=0.15):
+    """Seeded slate of props (N players x M prop types x K books) and the matching stats frame
+
+    A scraped_names share of players is listed under a variant spelling, so the name join has work to do.
+    """
+    rng = np.random.default_rng(seed)
+    prop_types = PROP_TYPES[:n_prop_types]
+    books = SPORTSBOOKS[:n_books]
+    names = make_players(n_players, rng)
+    stats_df = make_stats(names, rng)
+
+    listed = names.copy()
+    variant = rng.random(n_players) < scraped_names
+    listed[variant] = [scraped_name(name, rng) for name in names[variant]]
+
+    player = np.repeat(np.arange(n_players), n_prop_types * n_books)
+    prop_type = np.tile(np.repeat(prop_types, n_books), n_players)
+    book = np.tile(books, n_players * n_prop_types)
+
+    # Consensus line near the player's average; each book shades it a little
+    averages = np.full(len(player), np.nan)
+    for market, column in PROP_STATS.items():
+        rows = prop_type == market
+        averages[rows] = stats_df[column].to_numpy()[player[rows]]
+    threes = prop_type == 'Three Pointers'
+    averages[threes] = stats_df['ppg'].to_numpy()[player[threes]] * rng.uniform(0.03, 0.14, threes.sum())
+    market_id = np.arange(len(player)) // n_books
+    consensus = averages[market_id * n_books] * rng.normal(1.0, 0.08, len(player))[market_id * n_books]
+    shade = rng.choice([-1.0, -0.5, 0.0, 0.0, 0.0, 0.5, 1.0], len(player))
+    prop_line = np.maximum(np.floor(consensus + shade) + 0.5, 0.5)
+
+    odds = fair_odds(np.clip(rng.normal(0.524, 0.03, len(player)), 0.35, 0.68))
+    props_df = pd.DataFrame({
+        'player_name': listed[player],
+        'prop_type': prop_type,
+        'prop_line': prop_line,
+        'odds': [f'+{o}' if o > 0 else str(o) for o in odds],
+        'sportsbook': book,
+    })
+    return props_df, stats_df
+
+
+def parse_size(spec):
+    """'300x5x5' -> (players, prop types, books)"""
+    players, prop_types, books = (int(part) for part in spec.lower().split('x'))
+    return players, min(prop_types, len(PROP_TYPES)), min(books, len(SPORTSBOOKS))
@@ -0,0 +1,208 @@
+# game_log_store.py
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from stats_cache import DEFAULT_CACHE_DIR
+
+DEFAULT_DB_PATH = os.path.join(DEFAULT_CACHE_DIR, 'game_logs.sqlite')
+ROLLING_WINDOWS = (5, 10, 20)
+LOG_STATS = ['pts', 'reb', 'ast', 'stl', 'blk', 'min']
+RATE_STATS = ['pts', 'reb', 'ast']
+
+# nba_api PlayerGameLogs column -> store column
+SOURCE_COLUMNS = {
+    'PLAYER_NAME': 'player_name',
+    'GAME_ID': 'game_id',
+    'GAME_DATE': 'game_date',
+    'MIN': 'min',
+    'PTS': 'pts',
+    'REB': 'reb',
+    'AST': 'ast',
+    'STL': 'stl',
+    'BLK': 'blk',
+}
+
+
+def feature_columns():
+    """Column names of the rolling feature table, e.g. pts_l5 and pts_per_min_l5"""
+    columns = []
+    for window in ROLLING_WINDOWS:
+        columns += [f'{stat}_l{window}' for stat in LOG_STATS]
+        columns += [f'{stat}_per_min_l{window}' for stat in RATE_STATS]
+    return columns
+
+
+class NBAGameLogSource:
+    """League-wide game logs from the NBA API, optionally starting at a date"""
+
+    def __init__(self, season='2024-25', season_type='Regular Season'):
+        self.season = season
+        self.season_type = season_type
+
+    def __call__(self, since=None):
+        from nba_api.stats.endpoints import playergamelogs
+
+        date_from = datetime.strptime(since, '%Y-%m-%d').strftime('%m/%d/%Y') if since else ''
+        logs = playergamelogs.PlayerGameLogs(
+            season_nullable=self.season,
+            season_type_nullable=self.season_type,
+            date_from_nullable=date_from,
+        )
+        return logs.get_data_frames()[0]
+
+
+class FrameGameLogSource:
+    """Serve game logs from a local frame or CSV, for offline runs and tests"""
+
+    def __init__(self, logs):
+        self.logs = pd.read_csv(logs) if isinstance(logs, str) else logs
+
+    def __call__(self, since=None):
+        if since is None:
+            return self.logs
+        dates = pd.to_datetime(self.logs['GAME_DATE']).dt.strftime('%Y-%m-%d')
+        return self.logs[dates >= since]
+
+
+class GameLogStore:
+    """SQLite store of per-game box scores with incrementally maintained rolling form"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, source=None):
+        self.db_path = db_path
+        self.source = source or NBAGameLogSource()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.create_tables()
+
+    def create_tables(self):
+        stat_columns = ', '.join(f'{stat} REAL' for stat in LOG_STATS)
+        feature_defs = ', '.join(f'{column} REAL' for column in feature_columns())
+        with self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS game_logs (
+                    player_name TEXT NOT NULL,
+                    game_id TEXT NOT NULL,
+                    game_date TEXT NOT NULL,
+                    {stat_columns},
+                    PRIMARY KEY (player_name, game_id)
+                )""")
+            self.conn.execute(
+                'CREATE INDEX IF NOT EXISTS game_logs_player_date ON game_logs (player_name, game_date)')
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS rolling_features (
+                    player_name TEXT PRIMARY KEY,
+                    games INTEGER NOT NULL,
+                    last_game_date TEXT,
+                    {feature_defs}
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    last_game_date TEXT,
+                    synced_at REAL
+                )""")
+
+    def last_game_date(self):
+        row = self.conn.execute('SELECT last_game_date FROM sync_state WHERE id = 1').fetchone()
+        return row[0] if row else None
+
+    def sync(self):
+        """Append games not seen before and refresh rolling form for the players they touch"""
+        print("📚 Syncing game logs...")
+        start = time.perf_counter()
+        since = self.last_game_date()
+
+        # Re-read the last synced day too, since late games land on the same date
+        incoming = self.normalize(self.source(since))
+        new_games = self.unseen(incoming)
+
+        with self.conn:
+            columns = ['player_name', 'game_id', 'game_date'] + LOG_STATS
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO game_logs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                new_games[columns].itertuples(index=False, name=None),
+            )
+            touched = new_games['player_name'].unique()
+            for player_name in touched:
+                self.update_features(player_name)
+
+            last_date = max(filter(None, [since, incoming['game_date'].max() if len(incoming) else None]), default=None)
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sync_state (id, last_game_date, synced_at) VALUES (1, ?, ?)',
+                (last_date, time.time()),
+            )
+
+        print(f"✅ Added {len(new_games)} new games for {len(touched)} players "
+              f"(since {since or 'season start'}) in {time.perf_counter() - start:.2f}s")
+        return len(new_games)
+
+    def normalize(self, logs):
+        logs = logs[list(SOURCE_COLUMNS)].rename(columns=SOURCE_COLUMNS)
+        logs = logs.assign(
+            game_id=logs['game_id'].astype(str),
+            game_date=pd.to_datetime(logs['game_date']).dt.strftime('%Y-%m-%d'),
+        )
+        return logs.drop_duplicates(['player_name', 'game_id'])
+
+    def unseen(self, incoming):
+        """Rows whose (player, game) key is not stored yet"""
+        if incoming.empty:
+            return incoming
+        oldest = incoming['game_date'].min()
+        stored = pd.read_sql_query(
+            'SELECT player_name, game_id FROM game_logs WHERE game_date >= ?', self.conn, params=(oldest,))
+        keys = incoming.merge(stored, on=['player_name', 'game_id'], how='left', indicator=True)
+        return incoming[(keys['_merge'] == 'left_only').to_numpy()].sort_values('game_date')
+
+    def update_features(self, player_name):
+        """Recompute one player's rolling windows from their last games only"""
+        longest = max(ROLLING_WINDOWS)
+        recent = pd.read_sql_query(
+            f"SELECT game_date, {', '.join(LOG_STATS)} FROM game_logs "
+            'WHERE player_name = ? ORDER BY game_date DESC, game_id DESC LIMIT ?',
+            self.conn, params=(player_name, longest),
+        )
+        games = self.conn.execute(
+            'SELECT COUNT(*) FROM game_logs WHERE player_name = ?', (player_name,)).fetchone()[0]
+
+        features = {}
+        for window in ROLLING_WINDOWS:
+            last_games = recent.head(window)
+            means = last_games[LOG_STATS].mean()
+            minutes = last_games['min'].sum()
+            for stat in LOG_STATS:
+                features[f'{stat}_l{window}'] = float(means[stat])
+            for stat in RATE_STATS:
+                features[f'{stat}_per_min_l{window}'] = float(last_games[stat].sum() / minutes) if minutes else None
+
+        columns = ['player_name', 'games', 'last_game_date'] + list(features)
+        values = [player_name, games, recent['game_date'].iloc[0]] + list(features.values())
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO rolling_features ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            values,
+        )
+
+    def features(self, players=None):
+        """Rolling form per player, read straight from the feature table"""
+        if players is None:
+            return pd.read_sql_query('SELECT * FROM rolling_features', self.conn)
+        players = list(players)
+        frames = []
+        # Stay under SQLite's bound-parameter limit
+        for offset in range(0, len(players), 500):
+            chunk = players[offset:offset + 500]
+            frames.append(pd.read_sql_query(
+                f"SELECT * FROM rolling_features WHERE player_name IN ({', '.join('?' * len(chunk))})",
+                self.conn, params=chunk,
+            ))
+        if not frames:
+            return pd.read_sql_query('SELECT * FROM rolling_features WHERE 0', self.conn)
+        return pd.concat(frames, ignore_index=True)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,171 @@
+# market_index.py
+import numpy as np
+import pandas as pd
+
+from prop_model import american_odds_arrays
+from prop_schema import odds_labels
+
+MARKET_KEY = ['player_name', 'prop_type']
+QUOTE_COLUMNS = ['sportsbook', 'prop_line', 'odds', 'implied_prob', 'payout']
+SUMMARY_COLUMNS = [
+    'over_book', 'over_line', 'over_odds', 'over_prob',
+    'under_book', 'under_line', 'under_odds', 'under_prob',
+    'fair_line', 'fair_over_prob', 'books', 'middle', 'arbitrage',
+]
+
+
+def prepare_quotes(props_df):
+    """Quote table with odds parsed once; rows without a side are overs, as scraped"""
+    if 'payout' in props_df:
+        implied = props_df['implied_prob'].to_numpy(dtype=float)
+        payout = props_df['payout'].to_numpy(dtype=float)
+    else:
+        _, implied, payout = american_odds_arrays(props_df['odds'])
+    side = props_df['side'].astype(str).str.lower().to_numpy() if 'side' in props_df else 'over'
+    return pd.DataFrame({
+        'player_name': props_df['player_name'].to_numpy(),
+        'prop_type': props_df['prop_type'].to_numpy(),
+        'sportsbook': props_df['sportsbook'].to_numpy(),
+        'side': side,
+        'prop_line': props_df['prop_line'].to_numpy(dtype=float),
+        'odds': odds_labels(props_df['odds']),
+        'implied_prob': implied,
+        'payout': payout,
+    })
+
+
+def quote_prices(odds):
+    """Scalar twin of american_odds_arrays for single-quote updates"""
+    try:
+        american = float(odds)
+    except (TypeError, ValueError):
+        return np.nan, np.nan
+    if american < 0:
+        return -american / (100 - american), 100 / -american
+    return 100 / (american + 100), american / 100
+
+
+def flag_markets(summary):
+    """Middles and arbitrage from the best over and best under of each market"""
+    both = summary['over_line'].notna() & summary['under_line'].notna()
+    summary['middle'] = both & (summary['over_line'] < summary['under_line'])
+    summary['arbitrage'] = (both & (summary['over_line'] <= summary['under_line'])
+                            & (summary['over_prob'] + summary['under_prob'] < 1.0))
+    return summary
+
+
+class MarketIndex:
+    """Best over/under across books per (player, prop_type), kept current one quote at a time"""
+
+    def __init__(self, props_df):
+        self.quotes = prepare_quotes(props_df).drop_duplicates(
+            MARKET_KEY + ['sportsbook', 'side'], keep='last').reset_index(drop=True)
+        self._summary = self.summarize(self.quotes)
+        self._rows = None
+        self._books = {}
+        self._dirty = {}
+
+    @property
+    def summary(self):
+        """Per-market table, with pending single-quote updates folded in as one batch"""
+        if self._dirty:
+            updates = pd.DataFrame.from_dict(self._dirty, orient='index', columns=SUMMARY_COLUMNS)
+            updates.index = pd.MultiIndex.from_tuples(updates.index, names=MARKET_KEY)
+            self._dirty = {}
+            known = updates.index.isin(self._summary.index)
+            untouched = self._summary.drop(index=updates.index[known])
+            self._summary = pd.concat([untouched, updates.astype(self._summary.dtypes.to_dict(), errors='ignore')])
+        return self._summary
+
+    def summarize(self, quotes):
+        """Vectorized best-price summary for every market"""
+        best = {}
+        for side, line_first in (('over', True), ('under', False)):
+            side_quotes = quotes[quotes['side'] == side]
+            # Over: lowest line wins; under: highest line; ties go to the better payout
+            ranked = side_quotes.sort_values(['prop_line', 'payout'], ascending=[line_first, False])
+            top = ranked.drop_duplicates(MARKET_KEY).set_index(MARKET_KEY)
+            best[side] = top[['sportsbook', 'prop_line', 'odds', 'implied_prob']].set_axis(
+                [f'{side}_book', f'{side}_line', f'{side}_odds', f'{side}_prob'], axis=1)
+
+        summary = best['over'].join(best['under'], how='outer')
+        summary['books'] = quotes.groupby(MARKET_KEY)['sportsbook'].nunique().reindex(summary.index)
+
+        # No-vig fair price from books that quote both sides of the same line
+        pairs = quotes[quotes['side'] == 'over'].merge(
+            quotes[quotes['side'] == 'under'], on=MARKET_KEY + ['sportsbook', 'prop_line'], suffixes=('_o', '_u'))
+        pairs['fair_over_prob'] = pairs['implied_prob_o'] / (pairs['implied_prob_o'] + pairs['implied_prob_u'])
+        fair = pairs.groupby(MARKET_KEY).agg(fair_line=('prop_line', 'median'),
+                                             fair_over_prob=('fair_over_prob', 'mean'))
+        summary = summary.join(fair, how='left')
+        return flag_markets(summary)[SUMMARY_COLUMNS]
+
+    def market_rows(self, market):
+        """Quotes of one market, as {(book, side): quote}; built on first touch"""
+        if market not in self._books:
+            if self._rows is None:
+                self._rows = self.quotes.groupby(MARKET_KEY, sort=False).indices
+                self._columns = [self.quotes[column].to_numpy() for column in
+                                 ('sportsbook', 'side', 'prop_line', 'odds', 'implied_prob', 'payout')]
+            positions = self._rows.get(market, [])
+            book, side, line, odds, implied, payout = (column[positions] for column in self._columns)
+            self._books[market] = {
+                key: quote for key, quote in zip(zip(book, side), zip(line, odds, implied, payout))
+            }
+        return self._books[market]
+
+    def update(self, player_name, prop_type, sportsbook, prop_line, odds, side='over'):
+        """Apply one changed quote (prop_line None removes it) and refresh only its market"""
+        market = (player_name, prop_type)
+        books = self.market_rows(market)
+        if prop_line is None:
+            books.pop((sportsbook, side), None)
+        else:
+            implied, payout = quote_prices(odds)
+            books[(sportsbook, side)] = (float(prop_line), str(odds), implied, payout)
+        row = self.summarize_market(books)
+        self._dirty[market] = row
+        return dict(zip(SUMMARY_COLUMNS, row))
+
+    def summarize_market(self, books):
+        """Same summary as summarize(), for one market's handful of quotes"""
+        best = {'over': None, 'under': None}
+        for (book, side), (line, odds, implied, payout) in books.items():
+            current = best.get(side)
+            if side == 'over':
+                better = current is None or (line, -payout) < (current[1], -current[4])
+            else:
+                better = current is None or (-line, -payout) < (-current[1], -current[4])
+            if better:
+                best[side] = (book, line, odds, implied, payout)
+
+        fair = [(line, implied / (implied + books[(book, 'under')][2]))
+                for (book, side), (line, odds, implied, payout) in books.items()
+                if side == 'over' and (book, 'under') in books and books[(book, 'under')][0] == line]
+
+        row = {}
+        for side in ('over', 'under'):
+            quote = best[side] or (np.nan, np.nan, np.nan, np.nan, np.nan)
+            row[f'{side}_book'], row[f'{side}_line'], row[f'{side}_odds'], row[f'{side}_prob'] = quote[:4]
+        row['fair_line'] = float(np.median([line for line, _ in fair])) if fair else np.nan
+        row['fair_over_prob'] = float(np.mean([prob for _, prob in fair])) if fair else np.nan
+        row['books'] = len({book for book, _ in books})
+
+        both = best['over'] is not None and best['under'] is not None
+        row['middle'] = both and row['over_line'] < row['under_line']
+        row['arbitrage'] = (both and row['over_line'] <= row['under_line']
+                            and row['over_prob'] + row['under_prob'] < 1.0)
+        return [row[column] for column in SUMMARY_COLUMNS]
+
+    def flagged(self):
+        """Markets with a middle or an arbitrage across books"""
+        return self.summary[self.summary['middle'] | self.summary['arbitrage']]
+
+    def annotate(self, scored_df):
+        """Mark each over row that is the best available line, and attach the fair price"""
+        # Reindex rather than join, so the scored frame keeps its categorical key columns
+        keys = pd.MultiIndex.from_arrays([scored_df[column].to_numpy() for column in MARKET_KEY])
+        market = self.summary[['over_book', 'over_line', 'fair_over_prob']].reindex(keys)
+        best_over = ((scored_df['sportsbook'].to_numpy() == market['over_book'].to_numpy())
+                     & (scored_df['prop_line'].to_numpy(dtype=float) == market['over_line'].to_numpy(dtype=float)))
+        return scored_df.assign(fair_over_prob=market['fair_over_prob'].to_numpy(), best_over=best_over)
@@ -0,0 +1,142 @@
+# name_resolver.py
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+import pandas as pd
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+FUZZY_CUTOFF = 0.88
+FUZZY_MARGIN = 0.05         # a fuzzy winner must beat the runner-up by this much
+GIVEN_NAME_CUTOFF = 0.8     # 'jalen' vs 'jaylin' (0.73) are different players, not a typo
+
+
+def normalize_name(name):
+    """Fold accents, case, punctuation and generational suffixes: 'Luka Dončić Jr.' -> 'luka doncic'"""
+    if not isinstance(name, str):
+        return ''
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch)).lower()
+    folded = re.sub(r"[.'`’]", '', folded)
+    tokens = re.split(r'[\s,-]+', folded)
+    return ' '.join(token for token in tokens if token and token not in NAME_SUFFIXES)
+
+
+def same_player_shape(key, candidate):
+    """Normalized names that could be one player: same surname, given names a prefix or near-typo"""
+    tokens, other = key.split(), candidate.split()
+    if not tokens or not other or tokens[-1] != other[-1]:
+        return False
+    given, other_given = tokens[0], other[0]
+    if given.startswith(other_given) or other_given.startswith(given):
+        return True
+    return difflib.SequenceMatcher(None, given, other_given).ratio() >= GIVEN_NAME_CUTOFF
+
+
+class PlayerNameResolver:
+    """Map scraped player names onto the canonical names in a stats frame"""
+
+    def __init__(self, canonical_names, memo_path=None, fuzzy_cutoff=FUZZY_CUTOFF):
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.memo_path = memo_path
+        self.index = {}
+        for name in canonical_names:
+            self.index.setdefault(normalize_name(name), name)
+        self.by_surname = {}
+        for key in self.index:
+            if key:
+                self.by_surname.setdefault(key.split()[-1], []).append(key)
+        self.canonical = set(self.index.values())
+        self.memo = self.load_memo()
+        self.counts = {'exact': 0, 'fuzzy': 0, 'memo': 0, 'miss': 0}
+        self.last_lookup_seconds = 0.0
+
+    @classmethod
+    def from_stats(cls, stats_df, **kwargs):
+        return cls(stats_df['player_name'].dropna().unique(), **kwargs)
+
+    def load_memo(self):
+        """Fuzzy resolutions from earlier runs, minus names no longer in the index or not plausibly the same"""
+        if not self.memo_path or not os.path.exists(self.memo_path):
+            return {}
+        try:
+            with open(self.memo_path, encoding='utf-8') as f:
+                memo = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {raw: name for raw, name in memo.items()
+                if name in self.canonical and same_player_shape(normalize_name(raw), normalize_name(name))}
+
+    def save_memo(self):
+        if not self.memo_path:
+            return
+        os.makedirs(os.path.dirname(self.memo_path) or '.', exist_ok=True)
+        # Per process and thread, so concurrent runs never rename each other's half-written file
+        tmp_path = f'{self.memo_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.memo, f, ensure_ascii=False, indent=0, sort_keys=True)
+        os.replace(tmp_path, self.memo_path)
+
+    def resolve(self, name):
+        """Canonical name for one scraped name, or None"""
+        if name in self.canonical:
+            self.counts['exact'] += 1
+            return name
+
+        # Exact normalized match beats anything remembered from an earlier fuzzy guess
+        key = normalize_name(name)
+        if key in self.index:
+            self.counts['exact'] += 1
+            return self.index[key]
+        if name in self.memo:
+            self.counts['memo'] += 1
+            return self.memo[name]
+
+        match = self.fuzzy_match(key)
+        if match is not None:
+            self.counts['fuzzy'] += 1
+            self.memo[name] = match
+            return match
+
+        self.counts['miss'] += 1
+        return None
+
+    def fuzzy_match(self, key):
+        """Only a single same-surname candidate, clearly ahead of any other, is accepted (and memoized)"""
+        ranked = sorted(
+            ((difflib.SequenceMatcher(None, key, candidate).ratio(), candidate)
+             for candidate in self.by_surname.get(key.split()[-1] if key else '', [])
+             if same_player_shape(key, candidate)),
+            reverse=True)
+        if not ranked or ranked[0][0] < self.fuzzy_cutoff:
+            return None
+        if len(ranked) > 1 and ranked[0][0] - ranked[1][0] < FUZZY_MARGIN:
+            return None
+        return self.index[ranked[0][1]]
+
+    def resolve_series(self, names):
+        """Resolve each distinct name once and broadcast back onto the rows"""
+        start = time.perf_counter()
+        unique_names = pd.unique(names)
+        memo_size = len(self.memo)
+        mapping = {name: self.resolve(name) for name in unique_names}
+        resolved = names.map(mapping)
+        self.last_lookup_seconds = time.perf_counter() - start
+        # Only a fuzzy match adds entries; exact, memo and missed lookups leave the file alone
+        if len(self.memo) != memo_size:
+            self.save_memo()
+        return resolved
+
+    def join_report(self, resolved):
+        """Print how many prop rows found stats and how long lookup took"""
+        matched = int(resolved.notna().sum())
+        total = len(resolved)
+        rate = matched / total * 100 if total else 0.0
+        print(f"🔗 Name join: {matched}/{total} props matched ({rate:.1f}%) - "
+              f"exact {self.counts['exact']}, memo {self.counts['memo']}, "
+              f"fuzzy {self.counts['fuzzy']}, missed {self.counts['miss']} "
+              f"in {self.last_lookup_seconds * 1000:.1f} ms")
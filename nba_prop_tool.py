@@ -1,34 +1,91 @@
 import pandas as pd
-from nba_api.stats.endpoints import leagueleaders
-import requests
-from bs4 import BeautifulSoup
-import re
 from datetime import datetime
 import time
+import argparse
+import os
+from prop_scoring import PropScoringEngine
+from prop_model import PropProbabilityModel
+from stats_cache import StatsCache, DEFAULT_CACHE_DIR, DEFAULT_TTL_SECONDS
+from prop_fetcher import PooledFetcher, combine_props
+from prop_extractor import PropPageExtractor, NAME_PATTERN
+from name_resolver import PlayerNameResolver, normalize_name
+from game_log_store import GameLogStore
+from prop_daemon import PropDaemon
+from market_index import MarketIndex
+from prop_schema import StatsTable, compact_props, odds_labels, memory_bytes, memory_report
+from pipeline_profiler import PipelineProfiler
+from season_stats import SeasonStatsLoader, normalize_leaders, REGULAR_SEASON
+from report_view import print_report, save_snapshot, OPPORTUNITY_FIELDS, MARKET_FIELDS
+from report_store import ParquetReportBackend, make_report_backend, DEFAULT_REPORT_DIR
+
+PROPS_URL = 'https://www.actionnetwork.com/nba/props'
+
+# Surnames the scraper treats as real NBA players (normalized, so accents still match)
+COMMON_PLAYERS = frozenset(normalize_name(name) for name in [
+    'James', 'Curry', 'Durant', 'Jokic', 'Doncic', 'Antetokounmpo',
+    'Davis', 'Tatum', 'Butler', 'George', 'Leonard', 'Morant'])
+
+def plain_rows(frame, fields):
+    """Rows as lists of plain Python values in field order; column-wise tolist() beats to_dict('records')"""
+    return [list(values) for values in zip(*(frame[field].tolist() for field in fields))]
 
 class NBAPropToolFinal:
-    def __init__(self):
+    def __init__(self, stats_cache=None, league_leaders=None, offline=False, prop_urls=None, fetcher=None,
+                 game_log_store=None, report_backend=None, profiler=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.scoring_engine = PropScoringEngine()
+        self.probability_model = PropProbabilityModel()
+        self.offline = offline
+        self.stats_cache = stats_cache or StatsCache(offline=offline)
+        # Endpoint class is injectable so tests can swap in a local fake; nba_api loads on first fetch
+        self.league_leaders = league_leaders
+        self.prop_urls = list(prop_urls or [PROPS_URL])
+        self._fetcher = fetcher
+        self.extractor = PropPageExtractor()
+        self.name_memo_path = os.path.join(self.stats_cache.cache_dir, 'name_memo.json')
+        self.game_log_store = game_log_store
+        self.report_backend = report_backend or ParquetReportBackend()
+        self.market_index = None
+        self.stats_table = None
+        self.last_report = None
+        self.props_source = None    # 'scraped' or 'sample' for the last get_player_props()
+        
+        # Per-stage costs of run(); HTTP traffic and cache lookups are tracked as deltas
+        self.profiler = profiler or PipelineProfiler()
+        self.profiler.add_source(self.http_counters)
+        self.profiler.add_source(lambda: {f'cache_{kind}': n for kind, n in self.stats_cache.counts.items()})
+    
+    @property
+    def fetcher(self):
+        """Pooled HTTP fetcher, created (and requests imported) on first use"""
+        if self._fetcher is None:
+            self._fetcher = PooledFetcher(headers=self.headers)
+        return self._fetcher
+    
+    def http_counters(self):
+        if self._fetcher is None or not hasattr(self._fetcher, 'counters'):
+            return {}
+        return self._fetcher.counters()
+    
+    def league_leaders_endpoint(self):
+        if self.league_leaders is None:
+            from nba_api.stats.endpoints import leagueleaders
+            self.league_leaders = leagueleaders.LeagueLeaders
+        return self.league_leaders
     
     def get_player_stats(self, season='2024-25'):
         """Get comprehensive player stats from NBA API"""
         print("📊 Fetching NBA player statistics...")
         try:
-            leaders = leagueleaders.LeagueLeaders(season=season)
-            stats_df = leaders.get_data_frames()[0]
+            totals = self.stats_cache.get(
+                'leagueleaders', season,
+                lambda: self.league_leaders_endpoint()(season=season).get_data_frames()[0],
+            )
             
-            # Select relevant stats columns
-            stats_df = stats_df[['PLAYER', 'PTS', 'REB', 'AST', 'STL', 'BLK', 'MIN', 'GP']].copy()
-            stats_df.columns = ['player_name', 'ppg', 'rpg', 'apg', 'spg', 'bpg', 'mpg', 'games_played']
-            
-            # Calculate per-game averages
-            stats_df['ppg'] = stats_df['ppg'] / stats_df['games_played']
-            stats_df['rpg'] = stats_df['rpg'] / stats_df['games_played']
-            stats_df['apg'] = stats_df['apg'] / stats_df['games_played']
-            stats_df['spg'] = stats_df['spg'] / stats_df['games_played']
-            stats_df['bpg'] = stats_df['bpg'] / stats_df['games_played']
+            # Totals -> per-game averages (minutes included) in one vectorized step
+            stats_df = normalize_leaders(totals)
             
             print(f"✅ Successfully loaded stats for {len(stats_df)} players")
             return stats_df
@@ -37,44 +94,60 @@ class NBAPropToolFinal:
             print(f"❌ Error fetching stats: {e}")
             return self.get_sample_stats()
     
-    def get_player_props(self):
-        """Get player props from Action Network"""
+    def get_season_stats(self, seasons, season_types=(REGULAR_SEASON,), max_workers=4):
+        """Per-game stats for several seasons/season types, loaded concurrently through the cache"""
+        loader = SeasonStatsLoader(self.stats_cache, self.league_leaders, max_workers=max_workers)
+        return loader.load(seasons, season_types)
+    
+    def get_player_props(self, urls=None):
+        """Get player props from every configured Action Network page"""
         print("🎯 Scraping player prop bets...")
-        url = 'https://www.actionnetwork.com/nba/props'
+        urls = list(urls or self.prop_urls)
+        
+        if self.offline:
+            print("📴 Offline mode - using sample props")
+            self.props_source = 'sample'
+            return self.get_sample_props()
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            results = [result for result in self.fetcher.fetch_all(urls) if result.ok]
+            if not results:
+                raise RuntimeError(f"all {len(urls)} prop pages failed")
             
-            # Extract player names from the page
-            page_text = soup.get_text()
-            player_names = self.extract_player_names(page_text)
+            props_df = combine_props([self.parse_props_page(result.content) for result in results])
             
-            # Create realistic prop data based on actual players found
-            prop_data = []
-            for player in player_names[:12]:  # Use first 12 players found
-                prop_data.extend(self.generate_player_props(player))
-            
-            print(f"✅ Generated {len(prop_data)} prop lines for {len(player_names)} players")
-            return pd.DataFrame(prop_data)
+            print(f"✅ Generated {len(props_df)} prop lines for {props_df['player_name'].nunique()} players "
+                  f"from {len(results)}/{len(urls)} pages")
+            self.props_source = 'scraped'
+            return props_df
             
         except Exception as e:
             print(f"❌ Error scraping props: {e}")
+            self.props_source = 'sample'
             return self.get_sample_props()
     
+    def parse_props_page(self, content):
+        """Build prop lines for the players named on one page"""
+        # Stream the page and keep only name-bearing text and embedded state
+        page = self.extractor.extract(content)
+        player_names = self.extract_player_names(page.player_text())
+        
+        # Create realistic prop data based on actual players found
+        prop_data = []
+        for player in player_names[:12]:  # Use first 12 players found
+            prop_data.extend(self.generate_player_props(player))
+        
+        return pd.DataFrame(prop_data)
+    
     def extract_player_names(self, text):
         """Extract player names from page text"""
         # Common NBA player name patterns
-        name_pattern = r'[A-Z][a-z]+ [A-Z][a-z]+'
-        potential_names = re.findall(name_pattern, text)
+        potential_names = NAME_PATTERN.findall(text)
         
-        # Filter for actual NBA players
+        # Filter for actual NBA players with a set lookup per name token
         nba_players = []
-        common_players = ['James', 'Curry', 'Durant', 'Jokic', 'Doncic', 'Antetokounmpo', 
-                         'Davis', 'Tatum', 'Butler', 'George', 'Leonard', 'Morant']
-        
         for name in potential_names:
-            if any(player in name for player in common_players) and len(name) > 5:
+            if len(name) > 5 and not COMMON_PLAYERS.isdisjoint(normalize_name(name).split()):
                 nba_players.append(name)
         
         return list(set(nba_players))  # Remove duplicates
@@ -140,112 +213,77 @@ class NBAPropToolFinal:
         ]
         return pd.DataFrame(sample_props)
     
-    def analyze_opportunities(self, props_df, stats_df):
-        """Find betting opportunities by comparing props to stats"""
+    def analyze_opportunities(self, props_df, stats_df, market_index=None):
+        """Find betting opportunities by comparing props to stats
+
+        market_index, when given, already covers the whole slate (the daemon keeps one current);
+        otherwise an index is built from props_df, which is then assumed to be the whole slate.
+        """
         print("\n🔍 Analyzing betting opportunities...")
         
-        # Merge props with stats
-        merged_df = pd.merge(props_df, stats_df, on='player_name', how='left')
+        # Resolve scraped names onto the stats names so variants still join
+        props_df = self.resolve_player_names(props_df, stats_df)
         
-        opportunities = []
+        # Recent-form features join the per-player stats, read from the game-log store
+        if self.game_log_store is not None:
+            features = self.game_log_store.features(props_df['player_name'].unique())
+            stats_df = pd.merge(stats_df, features, on='player_name', how='left')
         
-        for _, row in merged_df.iterrows():
-            if pd.isna(row['ppg']):
-                continue  # Skip if no stats available
-                
-            if row['prop_type'] == 'Points':
-                edge = row['ppg'] - row['prop_line']
-                if edge > 1.5:
-                    opportunities.append(('STRONG BUY', 'Points', row, edge))
-                elif edge > 0.5:
-                    opportunities.append(('CONSIDER', 'Points', row, edge))
-                    
-            elif row['prop_type'] == 'Rebounds':
-                edge = row['rpg'] - row['prop_line']
-                if edge > 1.2:
-                    opportunities.append(('STRONG BUY', 'Rebounds', row, edge))
-                elif edge > 0.3:
-                    opportunities.append(('CONSIDER', 'Rebounds', row, edge))
-                    
-            elif row['prop_type'] == 'Assists':
-                edge = row['apg'] - row['prop_line']
-                if edge > 1.0:
-                    opportunities.append(('STRONG BUY', 'Assists', row, edge))
-                elif edge > 0.2:
-                    opportunities.append(('CONSIDER', 'Assists', row, edge))
+        # Stats stay in a keyed float64 table; props get categoricals, parsed odds and a player id
+        self.stats_table = StatsTable(stats_df)
+        props = compact_props(props_df, self.stats_table)
+        if self.profiler.trace_memory:
+            # Deep sizing of object columns is itself slow, so only when memory is being measured
+            print(memory_report(f"Props ({len(props)} rows)", memory_bytes(props_df), memory_bytes(props)))
         
-        return opportunities, merged_df
+        # Score every row at once (edge, rating, recommendation), then price hit probabilities
+        scored_df = self.probability_model.price(self.scoring_engine.score(props, self.stats_table),
+                                                 self.stats_table)
+        
+        # Compare the same market across books: best line, fair price, middles and arbs
+        self.market_index = market_index if market_index is not None else MarketIndex(props)
+        scored_df = self.market_index.annotate(scored_df)
+        opportunities = self.scoring_engine.opportunities(scored_df)
+        
+        return opportunities, scored_df
+    
+    def resolve_player_names(self, props_df, stats_df):
+        """Rewrite scraped player names to the canonical names in stats_df"""
+        resolver = PlayerNameResolver.from_stats(stats_df, memo_path=self.name_memo_path)
+        resolved = resolver.resolve_series(props_df['player_name'])
+        resolver.join_report(resolved)
+        return props_df.assign(player_name=resolved.fillna(props_df['player_name']))
+    
+    def report_snapshot(self, opportunities, merged_df):
+        """Plain-data copy of the report, so it can be re-rendered later without pandas"""
+        # Odds labels ('+120') once per distinct price, not per printed row
+        rows = opportunities.assign(odds=odds_labels(opportunities['odds']))
+        markets = []
+        if self.market_index is not None:
+            flagged = self.market_index.flagged().reset_index()
+            flagged['kind'] = flagged['arbitrage'].map({True: 'ARB', False: 'MIDDLE'})
+            markets = plain_rows(flagged, MARKET_FIELDS)
+        return {
+            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            'total_props': len(merged_df),
+            'opportunities': plain_rows(rows, OPPORTUNITY_FIELDS),
+            'line_shopping': markets,
+        }
     
     def generate_report(self, opportunities, merged_df):
         """Generate a comprehensive betting report"""
-        print("\n" + "="*70)
-        print("🏀 NBA PLAYER PROP BETTING REPORT")
-        print("="*70)
-        print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        print(f"📊 Total Props Analyzed: {len(merged_df)}")
-        print(f"🎯 Opportunities Found: {len(opportunities)}")
-        print("="*70)
-        
-        if not opportunities:
-            print("\n❌ No strong betting opportunities found today.")
-            print("💡 This is normal - valuable edges are rare!")
-            return
-        
-        # Group opportunities by rating
-        strong_plays = [opp for opp in opportunities if opp[0] == 'STRONG BUY']
-        consider_plays = [opp for opp in opportunities if opp[0] == 'CONSIDER']
-        
-        if strong_plays:
-            print(f"\n🔥 STRONG BETTING PLAYS ({len(strong_plays)} found):")
-            print("-" * 50)
-            for rating, prop_type, row, edge in strong_plays:
-                avg_stat = getattr(row, 'ppg' if prop_type=='Points' else 'rpg' if prop_type=='Rebounds' else 'apg')
-                print(f"✅ {row['player_name']} - {prop_type.upper()}")
-                print(f"   📊 Line: {row['prop_line']} | Avg: {avg_stat:.1f} | Edge: +{edge:.1f}")
-                print(f"   🎯 Odds: {row['odds']} | Book: {row['sportsbook']}")
-                print()
-        
-        if consider_plays:
-            print(f"\n⚡ CONSIDER THESE PLAYS ({len(consider_plays)} found):")
-            print("-" * 50)
-            for rating, prop_type, row, edge in consider_plays:
-                avg_stat = getattr(row, 'ppg' if prop_type=='Points' else 'rpg' if prop_type=='Rebounds' else 'apg')
-                print(f"📈 {row['player_name']} - {prop_type}")
-                print(f"   Line: {row['prop_line']} | Avg: {avg_stat:.1f} | Edge: +{edge:.1f}")
-                print(f"   Odds: {row['odds']} | Book: {row['sportsbook']}")
+        self.last_report = self.report_snapshot(opportunities, merged_df)
+        print_report(self.last_report)
     
     def export_results(self, merged_df, opportunities):
-        """Export results to CSV with additional analysis"""
-        # Add edge calculation to dataframe
-        def calculate_edge(row):
-            if row['prop_type'] == 'Points' and not pd.isna(row['ppg']):
-                return row['ppg'] - row['prop_line']
-            elif row['prop_type'] == 'Rebounds' and not pd.isna(row['rpg']):
-                return row['rpg'] - row['prop_line']
-            elif row['prop_type'] == 'Assists' and not pd.isna(row['apg']):
-                return row['apg'] - row['prop_line']
-            return 0
+        """Export results through the configured report backend"""
+        # Edge and recommendation come from the scoring engine
+        if 'recommendation' not in merged_df:
+            merged_df = self.probability_model.price(self.scoring_engine.score(merged_df))
         
-        merged_df['edge'] = merged_df.apply(calculate_edge, axis=1)
-        
-        # Add recommendation
-        def get_recommendation(row):
-            edge = row['edge']
-            if edge > 1.5:
-                return 'STRONG BUY'
-            elif edge > 0.5:
-                return 'CONSIDER'
-            elif edge < -1.0:
-                return 'AVOID'
-            else:
-                return 'NEUTRAL'
-        
-        merged_df['recommendation'] = merged_df.apply(get_recommendation, axis=1)
-        
-        # Export
-        filename = f'nba_prop_report_{datetime.now().strftime("%Y%m%d_%H%M")}.csv'
-        merged_df.to_csv(filename, index=False)
-        print(f"\n💾 Full report exported to: {filename}")
+        # Export; compact frames hand over the keyed stats table instead of merged columns
+        stats = self.stats_table if 'player_id' in merged_df else None
+        self.report_backend.write(merged_df, stats=stats)
         
         return merged_df
     
@@ -253,26 +291,99 @@ class NBAPropToolFinal:
         """Run the complete analysis"""
         print("🏀 NBA Player Prop Analysis Tool")
         print("=" * 50)
+        self.stats_cache.report()
+        
+        profiler = self.profiler
         
         # Get data
-        props_df = self.get_player_props()
-        stats_df = self.get_player_stats()
+        with profiler.stage('props', rows_in=len(self.prop_urls)) as stage:
+            props_df = self.get_player_props()
+            stage.rows_out = len(props_df)
+        with profiler.stage('stats') as stage:
+            stats_df = self.get_player_stats()
+            stage.rows_out = len(stats_df)
+        if self.game_log_store is not None and not self.offline:
+            with profiler.stage('game_logs') as stage:
+                try:
+                    stage.rows_out = self.game_log_store.sync()
+                except Exception as e:
+                    print(f"❌ Error syncing game logs: {e}")
         
         # Analyze
-        opportunities, merged_df = self.analyze_opportunities(props_df, stats_df)
+        with profiler.stage('analyze', rows_in=len(props_df)) as stage:
+            opportunities, merged_df = self.analyze_opportunities(props_df, stats_df)
+            stage.rows_out = len(merged_df)
         
-        # Generate report
-        self.generate_report(opportunities, merged_df)
+        # Generate report, and keep it for `prop_cli.py report`
+        with profiler.stage('report', rows_in=len(merged_df)) as stage:
+            self.generate_report(opportunities, merged_df)
+            save_snapshot(self.last_report, self.stats_cache.cache_dir)
+            stage.rows_out = len(opportunities)
         
         # Export results
-        final_df = self.export_results(merged_df, opportunities)
+        with profiler.stage('export', rows_in=len(merged_df)) as stage:
+            final_df = self.export_results(merged_df, opportunities)
+            stage.rows_out = len(final_df)
         
+        profiler.print_summary()
         print(f"\n✨ ANALYSIS COMPLETE!")
         print(f"📈 Summary: {len(opportunities)} opportunities found")
-        print(f"💾 Files: CSV report generated")
+        print(f"💾 Files: {self.report_backend.describe()}")
         print(f"🎯 Ready for delivery to client!")
 
+def main():
+    parser = argparse.ArgumentParser(description='NBA Player Prop Analysis Tool')
+    parser.add_argument('--offline', action='store_true',
+                        help='serve stats only from the local cache and skip scraping')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help='directory for cached NBA API stats')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL_SECONDS / 3600,
+                        help='hours before cached stats are refreshed')
+    parser.add_argument('--game-logs', action='store_true',
+                        help='sync game logs and add last 5/10/20 game form features')
+    parser.add_argument('--daemon', action='store_true',
+                        help='keep polling and only re-score lines that moved')
+    parser.add_argument('--interval', type=float, default=120,
+                        help='seconds between polls in daemon mode')
+    parser.add_argument('--export', choices=['parquet', 'csv'], default='parquet',
+                        help='report format: date-partitioned Parquet tables or one CSV per run')
+    parser.add_argument('--report-dir', default=None,
+                        help=f'where reports go (default: {DEFAULT_REPORT_DIR}/ for Parquet, . for CSV)')
+    parser.add_argument('--metrics', choices=['json', 'prometheus'], default=None,
+                        help='emit per-stage metrics (adds tracemalloc peak memory per stage)')
+    parser.add_argument('--metrics-file', default=None,
+                        help='write metrics here instead of stdout')
+    parser.add_argument('--profile', nargs='?', const='slowest_stage.prof', default=None,
+                        help='cProfile every stage and dump the slowest one (default: slowest_stage.prof)')
+    args = parser.parse_args()
+    
+    stats_cache = StatsCache(cache_dir=args.cache_dir, ttl_seconds=args.cache_ttl * 3600,
+                             offline=args.offline)
+    game_log_store = None
+    if args.game_logs:
+        game_log_store = GameLogStore(db_path=os.path.join(args.cache_dir, 'game_logs.sqlite'))
+    report_backend = make_report_backend(args.export, args.report_dir)
+    profiler = PipelineProfiler(trace_memory=args.metrics is not None, profile=args.profile is not None)
+    tool = NBAPropToolFinal(stats_cache=stats_cache, offline=args.offline, game_log_store=game_log_store,
+                            report_backend=report_backend, profiler=profiler)
+    if args.daemon:
+        PropDaemon(tool, interval=args.interval).run()
+        return
+    
+    tool.run()
+    if args.profile:
+        stage = profiler.dump_slowest(args.profile)
+        if stage is not None:
+            print(f"🔬 cProfile of slowest stage '{stage.name}' written to {args.profile}")
+    if args.metrics:
+        output = profiler.render(args.metrics)
+        if args.metrics_file:
+            with open(args.metrics_file, 'w') as f:
+                f.write(output)
+            print(f"📈 Stage metrics written to {args.metrics_file}")
+        else:
+            print(output)
+
 # Run the tool
 if __name__ == "__main__":
-    tool = NBAPropToolFinal()
-    tool.run()
\ No newline at end of file
+    main()
\ No newline at end of file
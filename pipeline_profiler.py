@@ -0,0 +1,155 @@
+# pipeline_profiler.py
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+METRIC_PREFIX = 'nba_prop_stage'
+
+# Prometheus metric name, help text and StageMetrics field for each exported value
+PROMETHEUS_METRICS = [
+    ('wall_seconds', 'Wall-clock time per pipeline stage', 'wall_s'),
+    ('cpu_seconds', 'Process CPU time per pipeline stage', 'cpu_s'),
+    ('peak_memory_bytes', 'tracemalloc peak above the stage start', 'peak_bytes'),
+    ('rows_in', 'Rows handed to the stage', 'rows_in'),
+    ('rows_out', 'Rows produced by the stage', 'rows_out'),
+]
+
+
+def format_sample(value):
+    """Integers verbatim (byte counts must not round), floats in short form"""
+    return str(value) if isinstance(value, int) else f'{value:g}'
+
+
+class StageMetrics:
+    """What one pipeline stage cost"""
+
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.peak_bytes = None
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.counters = {}
+        self.profile = None
+
+    def as_dict(self):
+        return {
+            'stage': self.name,
+            'wall_s': round(self.wall_s, 6),
+            'cpu_s': round(self.cpu_s, 6),
+            'peak_bytes': self.peak_bytes,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            **self.counters,
+        }
+
+
+class PipelineProfiler:
+    """Per-stage wall/CPU time, memory peak, row counts and counter deltas for one run"""
+
+    def __init__(self, trace_memory=False, profile=False):
+        self.trace_memory = trace_memory
+        self.profile = profile
+        self.stages = []
+        self.sources = []
+        self.started_at = time.time()
+
+    def add_source(self, counters):
+        """Register a callable returning cumulative counters, e.g. PooledFetcher.counters"""
+        self.sources.append(counters)
+
+    def read_counters(self):
+        totals = {}
+        for source in self.sources:
+            totals.update(source())
+        return totals
+
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        """Measure the with-block; set rows_out on the yielded StageMetrics"""
+        metrics = StageMetrics(name, rows_in)
+        before = self.read_counters()
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile() if self.profile else None
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield metrics
+        finally:
+            if profile is not None:
+                profile.disable()
+            metrics.wall_s = time.perf_counter() - wall_start
+            metrics.cpu_s = time.process_time() - cpu_start
+            if self.trace_memory:
+                metrics.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+                if started_tracing:
+                    tracemalloc.stop()
+            after = self.read_counters()
+            metrics.counters = {key: value - before.get(key, 0) for key, value in after.items()}
+            metrics.profile = profile
+            self.stages.append(metrics)
+
+    def slowest(self):
+        return max(self.stages, key=lambda stage: stage.wall_s, default=None)
+
+    def dump_slowest(self, path):
+        """Write the cProfile stats of the slowest stage; returns that stage"""
+        stage = self.slowest()
+        if stage is None or stage.profile is None:
+            return None
+        stage.profile.dump_stats(path)
+        return stage
+
+    def as_dicts(self):
+        return [stage.as_dict() for stage in self.stages]
+
+    def to_json(self):
+        return json.dumps({'started_at': self.started_at, 'stages': self.as_dicts()}, indent=2)
+
+    def to_prometheus(self):
+        """Prometheus text exposition format, one gauge family per metric"""
+        counter_names = sorted({key for stage in self.stages for key in stage.counters})
+        families = PROMETHEUS_METRICS + [(key, f"{key.replace('_', ' ')} during the stage", key)
+                                         for key in counter_names]
+
+        lines = []
+        for suffix, help_text, field in families:
+            samples = [(stage.name, stage.counters.get(field) if field in counter_names else getattr(stage, field))
+                       for stage in self.stages]
+            samples = [(name, value) for name, value in samples if value is not None]
+            if not samples:
+                continue
+            metric = f'{METRIC_PREFIX}_{suffix}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} gauge')
+            lines.extend(f'{metric}{{stage="{name}"}} {format_sample(value)}' for name, value in samples)
+        return '\n'.join(lines) + '\n'
+
+    def render(self, fmt):
+        if fmt == 'json':
+            return self.to_json()
+        if fmt == 'prometheus':
+            return self.to_prometheus()
+        raise ValueError(f"unknown metrics format: {fmt}")
+
+    def print_summary(self):
+        print("\n⏱️ Stage timings:")
+        for stage in self.stages:
+            rows = f"{stage.rows_in if stage.rows_in is not None else '-'} -> " \
+                   f"{stage.rows_out if stage.rows_out is not None else '-'} rows"
+            memory = f" | peak {stage.peak_bytes / 1e6:.1f} MB" if stage.peak_bytes is not None else ''
+            http = stage.counters.get('http_bytes')
+            traffic = (f" | {http:,} bytes, {stage.counters.get('http_retries', 0)} retries"
+                       if http else '')
+            print(f"   {stage.name:<10} {stage.wall_s * 1000:8.1f} ms wall {stage.cpu_s * 1000:8.1f} ms cpu | "
+                  f"{rows}{memory}{traffic}")
@@ -0,0 +1,178 @@
+# prop_cli.py
+# Keep module-level imports to the standard library: each subcommand imports what it needs,
+# so `report` from cached data never loads pandas, nba_api or requests.
+import argparse
+import os
+import sys
+import time
+
+DEFAULT_CACHE_DIR = '.nba_stats_cache'   # same as stats_cache.DEFAULT_CACHE_DIR, without importing pandas
+# Scraped and scored frames are run outputs, not stats: kept apart from the stats cache and its TTL
+RUNS_DIR = 'runs'
+PROPS_MAX_AGE_MINUTES = 30
+
+
+def run_path(cache_dir, name):
+    return os.path.join(cache_dir, RUNS_DIR, f'{name}.feather')
+
+
+def run_age(cache_dir, name):
+    """Seconds since the run frame was written, or None if there is none"""
+    path = run_path(cache_dir, name)
+    if not os.path.exists(path):
+        return None
+    return time.time() - os.path.getmtime(path)
+
+
+def save_run_frame(frame, cache_dir, name):
+    """Write atomically so a concurrent `analyze` or `export` never reads half a file"""
+    path = run_path(cache_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    frame.reset_index(drop=True).to_feather(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_run_frame(cache_dir, name):
+    import pandas as pd
+
+    return pd.read_feather(run_path(cache_dir, name))
+
+
+def make_tool(args, **kwargs):
+    from nba_prop_tool import NBAPropToolFinal
+    from stats_cache import StatsCache
+
+    stats_cache = StatsCache(cache_dir=args.cache_dir, ttl_seconds=args.cache_ttl * 3600, offline=args.offline)
+    return NBAPropToolFinal(stats_cache=stats_cache, offline=args.offline, **kwargs)
+
+
+def cmd_scrape(args):
+    """Fetch prop pages and keep the parsed lines for `analyze`"""
+    tool = make_tool(args)
+    props_df = tool.get_player_props(args.urls or None)
+    if tool.props_source != 'scraped':
+        # Sample lines must never pass for a scrape in later `analyze` runs
+        print("❌ No scraped lines to cache (sample props are not saved)")
+        return 1
+    save_run_frame(props_df, args.cache_dir, 'props')
+    print(f"💾 Cached {len(props_df)} prop lines for analyze")
+    return 0
+
+
+def cmd_stats(args):
+    """Load per-game stats through the cache: one season, or several with --seasons"""
+    tool = make_tool(args)
+    if args.seasons:
+        from season_stats import REGULAR_SEASON, PLAYOFFS
+
+        season_types = (REGULAR_SEASON, PLAYOFFS) if args.playoffs else (REGULAR_SEASON,)
+        stats = tool.get_season_stats(args.seasons, season_types, max_workers=args.workers)
+        print(f"✅ {len(stats)} season/type combinations ready under {tool.stats_cache.cache_dir}")
+    else:
+        tool.get_player_stats(args.season)
+
+
+def cmd_analyze(args):
+    """Score cached (or freshly scraped) props against stats and save the report for `report`/`export`"""
+    from report_view import save_snapshot
+    from stats_cache import format_age
+
+    game_log_store = None
+    if args.game_logs:
+        from game_log_store import GameLogStore
+        game_log_store = GameLogStore(db_path=os.path.join(args.cache_dir, 'game_logs.sqlite'))
+    tool = make_tool(args, game_log_store=game_log_store)
+
+    # Lines move: cached props are used only while young, or offline where nothing fresher exists
+    age = run_age(args.cache_dir, 'props')
+    fresh = age is not None and age <= args.props_max_age * 60
+    if age is not None and (fresh or args.offline):
+        props_df = load_run_frame(args.cache_dir, 'props')
+        note = '' if fresh else f' - older than {args.props_max_age:g}m, offline so using them anyway'
+        print(f"🎯 Using {len(props_df)} prop lines scraped {format_age(age)} ago{note}")
+    else:
+        if age is not None:
+            print(f"⌛ Cached props are {format_age(age)} old (max {args.props_max_age:g}m) - scraping fresh lines")
+        props_df = tool.get_player_props()
+    stats_df = tool.get_player_stats(args.season)
+
+    opportunities, scored_df = tool.analyze_opportunities(props_df, stats_df)
+    tool.generate_report(opportunities, scored_df)
+    save_snapshot(tool.last_report, args.cache_dir)
+    # Stats go back on for the saved copy, so `export` needs no stats table
+    save_run_frame(tool.stats_table.attach(scored_df), args.cache_dir, 'scored')
+
+
+def cmd_report(args):
+    """Re-print the last analyzed report; standard library only"""
+    from report_view import load_snapshot, print_report
+
+    snapshot = load_snapshot(args.cache_dir)
+    if snapshot is None:
+        print(f"❌ No analyzed report in {args.cache_dir}; run `analyze` first")
+        return 1
+    print_report(snapshot)
+    return 0
+
+
+def cmd_export(args):
+    """Write the last analyzed props through the chosen report backend"""
+    age = run_age(args.cache_dir, 'scored')
+    if age is None:
+        print(f"❌ No analyzed props in {args.cache_dir}; run `analyze` first")
+        return 1
+    from report_store import make_report_backend
+    from stats_cache import format_age
+
+    tool = make_tool(args, report_backend=make_report_backend(args.export, args.report_dir))
+    scored_df = load_run_frame(args.cache_dir, 'scored')
+    print(f"📤 Exporting {len(scored_df)} props analyzed {format_age(age)} ago")
+    tool.export_results(scored_df, tool.scoring_engine.opportunities(scored_df))
+    print(f"💾 Files: {tool.report_backend.describe()}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='NBA player prop pipeline, one stage at a time')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='cached stats, props and last report')
+    parser.add_argument('--cache-ttl', type=float, default=12.0, help='hours before cached stats are refreshed')
+    parser.add_argument('--offline', action='store_true', help='cached data only, no network')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help='fetch and parse prop pages')
+    scrape.add_argument('urls', nargs='*', help='prop pages (default: Action Network NBA props)')
+    scrape.set_defaults(func=cmd_scrape)
+
+    stats = commands.add_parser('stats', help='load player stats into the cache')
+    stats.add_argument('--season', default='2024-25')
+    stats.add_argument('--seasons', nargs='+', help='several seasons at once, e.g. 2022-23 2023-24')
+    stats.add_argument('--playoffs', action='store_true', help='with --seasons, also load playoffs')
+    stats.add_argument('--workers', type=int, default=4)
+    stats.set_defaults(func=cmd_stats)
+
+    analyze = commands.add_parser('analyze', help='score props against stats and print the report')
+    analyze.add_argument('--season', default='2024-25')
+    analyze.add_argument('--game-logs', action='store_true', help='add last 5/10/20 game form features')
+    analyze.add_argument('--props-max-age', type=float, default=PROPS_MAX_AGE_MINUTES,
+                         help='minutes before scraped props are re-scraped instead of reused')
+    analyze.set_defaults(func=cmd_analyze)
+
+    report = commands.add_parser('report', help='re-print the last analyzed report from cache')
+    report.set_defaults(func=cmd_report)
+
+    export = commands.add_parser('export', help='write the last analyzed props to the report store')
+    export.add_argument('--export', choices=['parquet', 'csv'], default='parquet')
+    export.add_argument('--report-dir', default=None)
+    export.set_defaults(func=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+# prop_daemon.py
+import time
+
+import numpy as np
+import pandas as pd
+
+from market_index import MARKET_KEY, MarketIndex
+from prop_schema import format_odds
+
+PROP_KEY = ['player_name', 'prop_type', 'sportsbook']
+PRICE_COLUMNS = ['prop_line', 'odds']
+
+
+class CycleResult:
+    """What one polling cycle changed and what it cost"""
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        self.latency = 0.0
+        self.added = 0
+        self.moved = 0
+        self.removed = 0
+        self.stats_changed = 0
+        self.rescored = 0
+        self.skipped = 0
+        self.changes = pd.DataFrame()
+
+    def as_dict(self):
+        return {
+            'cycle': self.cycle,
+            'latency_ms': round(self.latency * 1000, 1),
+            'added': self.added,
+            'moved': self.moved,
+            'removed': self.removed,
+            'stats_changed': self.stats_changed,
+            'rescored': self.rescored,
+            'skipped': self.skipped,
+        }
+
+
+class PropDaemon:
+    """Poll prop sources and re-score only lines that moved or whose player's stats changed"""
+
+    def __init__(self, tool, interval=120, on_change=None):
+        self.tool = tool
+        self.interval = interval
+        self.on_change = on_change or self.print_changes
+        self.scored = None          # latest scored row per prop key
+        self.market_index = None    # cross-book index over the whole slate, updated quote by quote
+        self.player_state = None    # per-player hash of stats (and form features)
+        self.history = []
+
+    def snapshot_players(self, stats_df):
+        """Hash each player's stats row so changes are a vectorized comparison"""
+        state_df = stats_df.drop_duplicates('player_name').set_index('player_name')
+        if self.tool.game_log_store is not None:
+            features = self.tool.game_log_store.features().set_index('player_name')
+            state_df = state_df.join(features, how='left')
+        return pd.util.hash_pandas_object(state_df, index=False)
+
+    def changed_players(self, player_state):
+        if self.player_state is None:
+            return set(player_state.index)
+        previous = self.player_state.reindex(player_state.index)
+        return set(player_state.index[(previous != player_state).to_numpy()])
+
+    def diff_props(self, props_df):
+        """Split the new snapshot into added, moved and unchanged keys; report removed keys"""
+        current = props_df.drop_duplicates(PROP_KEY, keep='last').set_index(PROP_KEY)
+        if self.scored is None:
+            return current, current.index, current.index[:0], current.index[:0], current.index[:0]
+
+        previous = self.scored[PRICE_COLUMNS]
+        added = current.index.difference(previous.index)
+        removed = previous.index.difference(current.index)
+        common = current.index.intersection(previous.index)
+
+        old_prices = previous.loc[common]
+        new_prices = current.loc[common, PRICE_COLUMNS]
+        # Compare odds as numbers: scored rows hold Int16 odds, fresh scrapes hold '+120'-style text
+        old_odds, new_odds = (pd.to_numeric(prices['odds'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+                              for prices in (old_prices, new_prices))
+        moved_mask = ((old_prices['prop_line'].to_numpy(dtype=float) != new_prices['prop_line'].to_numpy(dtype=float))
+                      | ((old_odds != new_odds) & ~(np.isnan(old_odds) & np.isnan(new_odds))))
+        return current, added, common[moved_mask], common[~moved_mask], removed
+
+    def cycle(self, number):
+        result = CycleResult(number)
+        start = time.perf_counter()
+
+        props_df = self.tool.get_player_props()
+        stats_df = self.tool.get_player_stats()
+        if self.tool.game_log_store is not None and not self.tool.offline:
+            try:
+                self.tool.game_log_store.sync()
+            except Exception as e:
+                print(f"❌ Error syncing game logs: {e}")
+
+        # Canonical names first, so a renamed scrape is not mistaken for a new line
+        props_df = self.tool.resolve_player_names(props_df, stats_df)
+        current, added, moved, unchanged, removed = self.diff_props(props_df)
+        player_state = self.snapshot_players(stats_df)
+        changed = self.changed_players(player_state) if self.scored is not None else set()
+
+        # Unchanged lines only need re-scoring when their player's inputs changed
+        stale = unchanged[unchanged.get_level_values('player_name').isin(changed)]
+        to_score = added.append(moved).append(stale)
+
+        # Best line and fair price are per market, so the index must see every book, not just rescored rows
+        if self.market_index is None:
+            self.market_index = MarketIndex(current.reset_index())
+        else:
+            self.update_market_index(current, added.append(moved), previous=self.scored, removed=removed)
+
+        previous = self.scored
+        # The first cycle always scores, so an empty board (off-day, off-season) still leaves an
+        # empty scored frame with the full column set for later cycles to diff against
+        if len(to_score) or previous is None:
+            _, rescored_df = self.tool.analyze_opportunities(current.loc[to_score].reset_index(), stats_df,
+                                                             market_index=self.market_index)
+            rescored_df = rescored_df.set_index(PROP_KEY)
+        else:
+            rescored_df = None
+
+        kept = previous.drop(index=removed.append(to_score), errors='ignore') if previous is not None else None
+        self.scored = pd.concat([frame for frame in (kept, rescored_df) if frame is not None])
+        self.tool.market_index = self.market_index
+        if previous is not None:
+            self.reannotate(added.append(moved).append(removed))
+        self.player_state = player_state
+
+        result.added, result.moved, result.removed = len(added), len(moved), len(removed)
+        result.stats_changed = len(changed)
+        result.rescored = len(to_score)
+        result.skipped = len(current) - len(to_score)
+        result.changes = self.collect_changes(previous, rescored_df, added, moved, removed)
+        result.latency = time.perf_counter() - start
+        return result
+
+    def update_market_index(self, current, changed, previous=None, removed=None):
+        """Apply added or moved quotes, and pulled ones, to the persistent market index"""
+        sides = current['side'] if 'side' in current else None
+        for key in changed:
+            side = str(sides.loc[key]).lower() if sides is not None else 'over'
+            self.market_index.update(*key, current.at[key, 'prop_line'], format_odds(current.at[key, 'odds']),
+                                     side=side)
+        if removed is not None and len(removed):
+            old_sides = previous['side'] if 'side' in previous else None
+            for key in removed:
+                side = str(old_sides.loc[key]).lower() if old_sides is not None else 'over'
+                self.market_index.update(*key, None, None, side=side)
+
+    def reannotate(self, changed):
+        """Refresh best_over and the fair price on every kept row of a market whose quotes changed"""
+        if not len(changed) or self.scored is None or self.scored.empty:
+            return
+        markets = changed.droplevel('sportsbook').unique()
+        rows = pd.MultiIndex.from_arrays(
+            [self.scored.index.get_level_values(column) for column in MARKET_KEY]).isin(markets)
+        if not rows.any():
+            return
+        annotated = self.market_index.annotate(self.scored[rows].reset_index())
+        self.scored.loc[rows, 'best_over'] = annotated['best_over'].to_numpy()
+        self.scored.loc[rows, 'fair_over_prob'] = annotated['fair_over_prob'].to_numpy()
+
+    def collect_changes(self, previous, rescored_df, added, moved, removed):
+        """New or moved lines, rows whose recommendation flipped, and pulled lines"""
+        frames = []
+        if rescored_df is not None:
+            change = pd.Series('rescored', index=rescored_df.index)
+            change[rescored_df.index.isin(added)] = 'new'
+            change[rescored_df.index.isin(moved)] = 'moved'
+            if previous is not None:
+                old_rec = previous['recommendation'].reindex(rescored_df.index)
+                flipped = (change == 'rescored') & (old_rec != rescored_df['recommendation'])
+                change[flipped] = 'recommendation'
+            emitted = rescored_df.assign(change=change)
+            frames.append(emitted[emitted['change'] != 'rescored'])
+        if previous is not None and len(removed):
+            frames.append(previous.loc[removed].assign(change='removed'))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames).reset_index()
+
+    def print_changes(self, result):
+        if result.changes.empty:
+            return
+        print(f"\n🔔 {len(result.changes)} changes:")
+        for row in result.changes.itertuples(index=False):
+            print(f"   [{row.change}] {row.player_name} {row.prop_type} {row.prop_line} "
+                  f"({format_odds(row.odds)}, {row.sportsbook}) -> {row.recommendation} | Edge: {row.edge:+.1f}")
+
+    def print_metrics(self, result):
+        print(f"⏱️ Cycle {result.cycle}: {result.latency * 1000:.0f} ms | rescored {result.rescored} | "
+              f"skipped {result.skipped} | +{result.added} new, {result.moved} moved, "
+              f"{result.removed} removed, {result.stats_changed} players with new stats")
+
+    def run(self, max_cycles=None):
+        """Poll until interrupted (or for max_cycles), emitting only what changed"""
+        print(f"🔁 Daemon mode: polling every {self.interval}s (Ctrl+C to stop)")
+        number = 0
+        try:
+            while max_cycles is None or number < max_cycles:
+                number += 1
+                started = time.monotonic()
+                try:
+                    result = self.cycle(number)
+                except Exception as e:
+                    # One bad poll (site down, odd page) must not end a long-running daemon
+                    print(f"❌ Cycle {number} failed: {e}")
+                    self.history.append({'cycle': number, 'error': str(e)})
+                else:
+                    self.history.append(result.as_dict())
+                    self.on_change(result)
+                    self.print_metrics(result)
+                if max_cycles is not None and number >= max_cycles:
+                    break
+                time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            print("\n👋 Daemon stopped")
+        return self.history
@@ -0,0 +1,110 @@
+# prop_extractor.py
+import json
+import re
+
+from lxml import etree
+
+# Capitalised word pairs, allowing accents, inner capitals and O'Neal / Gilgeous-Alexander
+NAME_TOKEN = r"[A-Z](?:[^\W\d_]|['-](?=[^\W\d_]))+"
+NAME_PATTERN = re.compile(rf'{NAME_TOKEN} {NAME_TOKEN}')
+PROP_PATTERNS = [
+    re.compile(r'(\w+ \w+) (OVER|UNDER) (\d+\.\d+)'),
+    re.compile(r'(\w+ \w+) (Points|Rebounds|Assists) (O|U) (\d+\.\d+)'),
+]
+
+# Next.js pages ship their data as JSON in this script tag
+STATE_SCRIPT_IDS = {'__NEXT_DATA__'}
+STATE_NAME_KEYS = {'full_name', 'player_name', 'display_name'}
+STATE_NAME_PATTERN = re.compile(r"[A-Z][\w'.-]+(?: [A-Z][\w'.-]+)+")
+
+SKIP_TEXT_TAGS = {'script', 'style', 'noscript', 'template'}
+CHUNK_SIZE = 64 * 1024
+
+
+class PageExtract:
+    """What the extractor pulled out of one page"""
+
+    def __init__(self):
+        self.name_texts = []      # text nodes containing a name-like pattern
+        self.prop_matches = []    # regex matches for 'Player OVER 24.5' style text
+        self.table_count = 0
+        self.state = None         # parsed embedded JSON state, if the page has one
+        self.state_names = []     # player names found inside that state
+
+    def player_text(self):
+        """Only the name-bearing text, for the legacy name filters"""
+        return '\n'.join(self.name_texts + self.state_names)
+
+
+class PropPageExtractor:
+    """Stream HTML through lxml's pull parser and keep only the prop-relevant bits"""
+
+    def __init__(self, chunk_size=CHUNK_SIZE, max_name_texts=None):
+        self.chunk_size = chunk_size
+        self.max_name_texts = max_name_texts
+
+    def extract(self, content):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        parser = etree.HTMLPullParser(events=('end',), encoding='utf-8')
+        page = PageExtract()
+        for offset in range(0, len(content), self.chunk_size):
+            parser.feed(content[offset:offset + self.chunk_size])
+            self.consume(parser, page)
+        parser.close()
+        self.consume(parser, page)
+        return page
+
+    def consume(self, parser, page):
+        for _, element in parser.read_events():
+            tag = element.tag if isinstance(element.tag, str) else ''
+            if tag == 'table':
+                page.table_count += 1
+
+            if tag in SKIP_TEXT_TAGS:
+                if tag == 'script' and element.get('id') in STATE_SCRIPT_IDS:
+                    self.read_state(element.text, page)
+            else:
+                self.scan_text(element.text, page)
+
+            # Children are finished, so their tails are complete; then drop them
+            for child in element:
+                self.scan_text(child.tail, page)
+            del element[:]
+
+    def scan_text(self, text, page):
+        if not text:
+            return
+        text = text.strip()
+        if not text:
+            return
+        if NAME_PATTERN.search(text) and (self.max_name_texts is None
+                                          or len(page.name_texts) < self.max_name_texts):
+            page.name_texts.append(text)
+        for pattern in PROP_PATTERNS:
+            page.prop_matches.extend(pattern.findall(text))
+
+    def read_state(self, text, page):
+        if not text:
+            return
+        try:
+            page.state = json.loads(text)
+        except ValueError:
+            return
+        page.state_names = sorted(set(find_state_names(page.state)))
+
+
+def find_state_names(node):
+    """Walk embedded JSON state and yield player-name values"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in STATE_NAME_KEYS and isinstance(value, str) and STATE_NAME_PATTERN.fullmatch(value):
+                    yield value
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
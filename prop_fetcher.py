@@ -0,0 +1,128 @@
+# prop_fetcher.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class FetchResult:
+    """Outcome of fetching one page"""
+
+    def __init__(self, url, status=None, content=b'', elapsed=0.0, attempts=0, error=None):
+        self.url = url
+        self.status = status
+        self.content = content
+        self.elapsed = elapsed
+        self.attempts = attempts
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.status is not None and self.status < 400
+
+    @property
+    def bytes(self):
+        return len(self.content)
+
+    def __repr__(self):
+        return f'FetchResult({self.url!r}, status={self.status}, elapsed={self.elapsed:.3f}s, attempts={self.attempts})'
+
+
+class PooledFetcher:
+    """Fetch many pages concurrently over one keep-alive session"""
+
+    def __init__(self, headers=None, max_per_host=4, max_workers=16, timeout=15,
+                 retries=3, backoff=0.5, session=None):
+        # requests is only imported once something is actually fetched
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.request_errors = requests.RequestException
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_per_host = max_per_host
+        self.max_workers = max_workers
+        self.session = session or requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        # Pool sized so each host keeps max_per_host connections alive
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_per_host)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._host_limits = {}
+        self._host_lock = threading.Lock()
+
+        # Cumulative traffic, read by the pipeline profiler as per-stage deltas
+        self.totals = {'http_requests': 0, 'http_bytes': 0, 'http_retries': 0}
+        self._totals_lock = threading.Lock()
+
+    def host_limit(self, url):
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def fetch(self, url):
+        """GET one url, retrying connection errors and retryable statuses with backoff"""
+        result = FetchResult(url)
+        start = time.perf_counter()
+        with self.host_limit(url):
+            for attempt in range(self.retries + 1):
+                result.attempts = attempt + 1
+                try:
+                    response = self.session.get(url, timeout=self.timeout)
+                    result.status = response.status_code
+                    result.content = response.content
+                    result.error = None
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        break
+                    result.error = f'HTTP {response.status_code}'
+                except self.request_errors as e:
+                    result.error = str(e)
+                if attempt < self.retries:
+                    time.sleep(self.backoff * 2 ** attempt)
+        result.elapsed = time.perf_counter() - start
+        with self._totals_lock:
+            self.totals['http_requests'] += result.attempts
+            self.totals['http_bytes'] += result.bytes
+            self.totals['http_retries'] += max(0, result.attempts - 1)
+        return result
+
+    def counters(self):
+        with self._totals_lock:
+            return dict(self.totals)
+
+    def fetch_all(self, urls):
+        """Fetch every url concurrently; results come back in input order"""
+        urls = list(urls)
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+            results = list(pool.map(self.fetch, urls))
+        for result in results:
+            status = result.error or result.status
+            print(f"   🌐 {result.url} -> {status} ({result.bytes:,} bytes, "
+                  f"{result.elapsed * 1000:.0f} ms, {result.attempts} attempt(s))")
+        return results
+
+    def close(self):
+        self.session.close()
+
+
+def combine_props(frames):
+    """Merge per-page prop frames into one, dropping lines seen on several pages"""
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=['player_name', 'prop_type', 'prop_line', 'odds', 'sportsbook'])
+    combined = pd.concat(frames, ignore_index=True)
+    return combined.drop_duplicates(
+        subset=['player_name', 'prop_type', 'prop_line', 'sportsbook'], keep='first'
+    ).reset_index(drop=True)
@@ -0,0 +1,124 @@
+# prop_model.py
+import numpy as np
+import pandas as pd
+
+from prop_scoring import stat_values
+
+# Per-market outcome distribution around the season average.
+# normal: sd = cv * mean; negbin: variance = mean + mean**2 / dispersion; poisson: variance = mean
+PROP_DISTRIBUTIONS = pd.DataFrame(
+    {
+        'stat_column': ['ppg', 'rpg', 'apg', 'spg', 'bpg'],
+        'family': ['normal', 'negbin', 'negbin', 'poisson', 'poisson'],
+        'cv': [0.28, np.nan, np.nan, np.nan, np.nan],
+        'dispersion': [np.nan, 8.0, 6.0, np.nan, np.nan],
+    },
+    index=pd.Index(['Points', 'Rebounds', 'Assists', 'Steals', 'Blocks'], name='prop_type'),
+)
+
+MIN_NORMAL_SD = 1.0
+
+
+def american_odds_arrays(odds):
+    """Parse American odds strings once into (odds, implied probability, profit per unit staked)"""
+    # A slate quotes a few dozen distinct prices; parse each once
+    codes, uniques = pd.factorize(pd.Series(odds, copy=False))
+    parsed = pd.to_numeric(pd.Series(uniques), errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    american = np.append(parsed, np.nan)[codes]
+    negative = american < 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        implied = np.where(negative, -american / (100 - american), 100 / (american + 100))
+        payout = np.where(negative, 100 / -american, american / 100)
+    return american, implied, payout
+
+
+def normal_cdf(z):
+    """Standard normal CDF via the Abramowitz-Stegun erf approximation (|error| < 1.5e-7)"""
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+
+def count_cdf(k, mean, dispersion=None):
+    """P(X <= k) for Poisson (dispersion None) or negative binomial counts, vectorized over rows"""
+    k = np.asarray(k, dtype=float)
+    mean = np.asarray(mean, dtype=float)
+    cdf = np.zeros_like(mean)
+    valid = (k >= 0) & np.isfinite(mean) & np.isfinite(k)
+    if not valid.any():
+        return np.where(k < 0, 0.0, np.nan)
+
+    if dispersion is None:
+        pmf = np.exp(-mean)
+    else:
+        dispersion = np.broadcast_to(np.asarray(dispersion, dtype=float), mean.shape)
+        success = dispersion / (dispersion + mean)
+        pmf = success ** dispersion
+
+    # Walk the pmf recurrence up to the largest line; rows stop accumulating past their own k
+    for i in range(int(np.max(k[valid])) + 1):
+        cdf += np.where(i <= k, pmf, 0.0)
+        if dispersion is None:
+            pmf = pmf * mean / (i + 1)
+        else:
+            pmf = pmf * (i + dispersion) / (i + 1) * (1 - success)
+
+    return np.where(np.isfinite(mean) & np.isfinite(k), np.minimum(cdf, 1.0), np.nan)
+
+
+class PropProbabilityModel:
+    def __init__(self, distributions=None):
+        self.distributions = PROP_DISTRIBUTIONS if distributions is None else distributions
+
+    def over_probability(self, merged_df, stats=None):
+        """P(stat > line) for every row, one batched call per distribution family"""
+        n_rows = len(merged_df)
+        over_prob = np.full(n_rows, np.nan)
+        prop_type = merged_df['prop_type'].to_numpy()
+        line = merged_df['prop_line'].to_numpy(dtype=float)
+
+        for family, params in self.distributions.groupby('family'):
+            rows = np.flatnonzero(np.isin(prop_type, params.index.to_numpy()))
+            if rows.size == 0:
+                continue
+            row_params = params.reindex(prop_type[rows])
+            mean = self.row_means(merged_df, rows, row_params['stat_column'].to_numpy(), stats)
+            row_line = line[rows]
+
+            if family == 'normal':
+                sd = np.maximum(row_params['cv'].to_numpy() * mean, MIN_NORMAL_SD)
+                over_prob[rows] = 1.0 - normal_cdf((row_line - mean) / sd)
+            elif family == 'negbin':
+                over_prob[rows] = 1.0 - count_cdf(np.floor(row_line), mean, row_params['dispersion'].to_numpy())
+            else:
+                over_prob[rows] = 1.0 - count_cdf(np.floor(row_line), mean)
+
+        return over_prob
+
+    def row_means(self, merged_df, rows, stat_columns, stats=None):
+        mean = np.full(rows.size, np.nan)
+        for column in np.unique(stat_columns):
+            values = stat_values(merged_df, column, stats)
+            if values is not None:
+                picked = stat_columns == column
+                mean[picked] = values[rows[picked]]
+        return mean
+
+    def price(self, scored_df, stats=None):
+        """Add model probabilities and expected value of the over next to the edge columns"""
+        priced_df = scored_df.copy()
+        over_prob = self.over_probability(priced_df, stats)
+        if 'payout' in priced_df:
+            # Compact props carry prices parsed at load time
+            implied_prob = priced_df['implied_prob'].to_numpy(dtype=float)
+            payout = priced_df['payout'].to_numpy(dtype=float)
+        else:
+            _, implied_prob, payout = american_odds_arrays(priced_df['odds'])
+
+        priced_df['over_prob'] = over_prob
+        priced_df['under_prob'] = 1.0 - over_prob
+        priced_df['implied_prob'] = implied_prob
+        priced_df['expected_value'] = over_prob * payout - (1.0 - over_prob)
+        return priced_df
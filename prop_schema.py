@@ -0,0 +1,110 @@
+# prop_schema.py
+import numpy as np
+import pandas as pd
+
+from prop_model import american_odds_arrays
+
+CATEGORY_COLUMNS = ['player_name', 'prop_type', 'sportsbook', 'side']
+
+
+def compact_props(props_df, stats_table=None):
+    """Props with categorical labels, Int16 American odds and float64 prices parsed once
+
+    Numbers stay float64 so edges and probabilities match the merged path bit for bit at the
+    rating thresholds; the memory saving comes from the categoricals and dropping merged stats.
+    With a stats_table, each row also gets the int32 player_id its stats live under (-1 if none).
+    """
+    # Columns collected first and framed once; inserting them one by one is most of the load cost
+    columns = {}
+    for column in props_df.columns:
+        values = props_df[column].to_numpy()
+        if column in CATEGORY_COLUMNS:
+            columns[column] = pd.Categorical(values)
+        elif column == 'prop_line':
+            columns[column] = values.astype(float)
+        elif column == 'odds':
+            american, implied, payout = american_odds_arrays(props_df['odds'])
+            # Unparseable odds stay missing rather than becoming a fake price
+            missing = np.isnan(american)
+            columns['odds'] = pd.arrays.IntegerArray(np.where(missing, 0, np.round(american)).astype(np.int16),
+                                                     missing)
+            columns['implied_prob'] = implied
+            columns['payout'] = payout
+        else:
+            columns[column] = values
+    if stats_table is not None:
+        names = columns.get('player_name')
+        if names is None:
+            names = pd.Categorical(props_df['player_name'].to_numpy())
+        # Look up each distinct name once, then spread the ids by category code
+        ids = np.append(stats_table.ids(names.categories), np.int32(-1))
+        columns['player_id'] = ids[names.codes]
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(props_df)))
+
+
+def format_odds(odds):
+    """-110 -> '-110', 120 -> '+120'; strings and missing values pass through"""
+    if isinstance(odds, (int, np.integer)):
+        return f'{odds:+d}'
+    if isinstance(odds, (float, np.floating)) and np.isfinite(odds):
+        return f'{int(odds):+d}'
+    if odds is pd.NA or odds is None:
+        return '<NA>'
+    return str(odds)
+
+
+def odds_labels(odds):
+    """Vectorized format_odds for a column: Int16 or string odds -> '+120' / '-110' labels"""
+    codes, uniques = pd.factorize(pd.Series(odds, copy=False))
+    labels = np.array([format_odds(value) for value in uniques] + ['<NA>'], dtype=object)
+    return labels[codes]
+
+
+class StatsTable:
+    """Per-player stats keyed by integer id: a float64 matrix plus the original frame for export"""
+
+    def __init__(self, stats_df):
+        self.frame = stats_df.drop_duplicates('player_name').reset_index(drop=True)
+        self.names = pd.Index(self.frame['player_name'])
+        numeric = self.frame.drop(columns='player_name').select_dtypes(include='number')
+        self.columns = {column: i for i, column in enumerate(numeric.columns)}
+
+        # Trailing all-NaN row: id -1 (no stats) gathers NaN without a mask
+        # Players x stats is small, so float64 costs nothing and keeps scores equal to the merged path
+        self.values = np.full((len(self.frame) + 1, len(self.columns)), np.nan)
+        self.values[:-1] = numeric.to_numpy(dtype=float, na_value=np.nan)
+
+    def __contains__(self, column):
+        return column in self.columns
+
+    def __len__(self):
+        return len(self.frame)
+
+    def ids(self, player_names):
+        """int32 id per name, -1 for players without stats"""
+        return pd.Categorical(player_names, categories=self.names).codes.astype(np.int32)
+
+    def lookup(self, column, player_ids):
+        """One stat for every row, gathered by player id"""
+        return self.values[np.asarray(player_ids), self.columns[column]]
+
+    def attach(self, props_df, columns=None):
+        """Props with stat columns gathered on, in place of a merge (export and CSV only)"""
+        columns = [column for column in (columns or self.frame.columns) if column != 'player_name']
+        picked = self.frame[columns].reindex(props_df['player_id'].to_numpy())
+        return pd.concat([props_df.drop(columns='player_id').reset_index(drop=True),
+                          picked.reset_index(drop=True)], axis=1)
+
+    def stats_for(self, player_ids):
+        """Stats rows of the players that appear in player_ids"""
+        ids = np.unique(np.asarray(player_ids))
+        return self.frame.iloc[ids[ids >= 0]].reset_index(drop=True)
+
+
+def memory_bytes(frame):
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+def memory_report(label, before, after):
+    return (f"🧮 {label}: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB "
+            f"({before / max(after, 1):.1f}x smaller)")
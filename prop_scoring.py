@@ -0,0 +1,120 @@
+# prop_scoring.py
+import numpy as np
+import pandas as pd
+
+# Season-average column each prop market is scored against
+PROP_STAT_COLUMNS = {
+    'Points': 'ppg',
+    'Rebounds': 'rpg',
+    'Assists': 'apg',
+}
+
+# Per-market edge cutoffs used to flag opportunities in the report
+EDGE_THRESHOLDS = pd.DataFrame(
+    {
+        'strong_buy': [1.5, 1.2, 1.0],
+        'consider': [0.5, 0.3, 0.2],
+    },
+    index=pd.Index(['Points', 'Rebounds', 'Assists'], name='prop_type'),
+)
+
+# Slate-wide edge cutoffs used for the exported recommendation column
+RECOMMENDATION_THRESHOLDS = {
+    'strong_buy': 1.5,
+    'consider': 0.5,
+    'avoid': -1.0,
+}
+
+# Edges are compared to thresholds after rounding, so 5.7 - 5.5 is 0.2 whether the average was
+# computed live, read back from a report, or stored as float32 by an older report part
+EDGE_DECIMALS = 4
+
+
+def stat_values(frame, column, stats=None):
+    """One stat per row: gathered by player_id from a StatsTable when given, else the frame's column"""
+    if stats is not None and column in stats:
+        return stats.lookup(column, frame['player_id'])
+    if column in frame:
+        return frame[column].to_numpy(dtype=float, na_value=np.nan)
+    return None
+
+
+class PropScoringEngine:
+    def __init__(self, stat_columns=None, thresholds=None, recommendation_thresholds=None):
+        self.stat_columns = dict(stat_columns or PROP_STAT_COLUMNS)
+        self.thresholds = EDGE_THRESHOLDS if thresholds is None else thresholds
+        self.recommendation_thresholds = dict(recommendation_thresholds or RECOMMENDATION_THRESHOLDS)
+
+    def prop_codes(self, prop_types):
+        """Map prop_type labels to positions in stat_columns (-1 if unscored)"""
+        categories = list(self.stat_columns)
+        return pd.Categorical(prop_types, categories=categories).codes.astype(np.intp)
+
+    def average_stats(self, merged_df, codes, stats=None):
+        """Pick the season average matching each row's prop type"""
+        if stats is not None and 'player_id' in merged_df:
+            # players x prop types table (NaN row for id -1, NaN column for code -1), one gather
+            per_type = np.full((len(stats) + 1, len(self.stat_columns) + 1), np.nan)
+            for i, column in enumerate(self.stat_columns.values()):
+                if column in stats:
+                    per_type[:, i] = stats.values[:, stats.columns[column]]
+            return per_type[merged_df['player_id'].to_numpy(), codes]
+
+        n_rows = len(merged_df)
+        stat_matrix = np.full((n_rows, len(self.stat_columns) + 1), np.nan)
+        for i, column in enumerate(self.stat_columns.values()):
+            values = stat_values(merged_df, column, stats)
+            if values is not None:
+                stat_matrix[:, i] = values
+
+        # Unscored prop types (code -1) land on the trailing all-NaN column
+        return stat_matrix[np.arange(n_rows), codes]
+
+    def edges(self, avg_stat, prop_line):
+        """Season average minus line, rounded to EDGE_DECIMALS; NaN where a row has no average"""
+        return np.round(avg_stat - prop_line.to_numpy(dtype=float), EDGE_DECIMALS)
+
+    def row_thresholds(self, column, codes):
+        """Broadcast a threshold column from the table onto every row"""
+        per_type = self.thresholds[column].reindex(list(self.stat_columns)).to_numpy(dtype=float)
+        per_type = np.append(per_type, np.nan)
+        return per_type[codes]
+
+    def score(self, merged_df, stats=None):
+        """Add avg_stat, edge, rating and recommendation columns in one pass
+
+        stats is an optional StatsTable; rows then carry a player_id instead of merged stat columns.
+        """
+        scored_df = merged_df.copy()
+        codes = self.prop_codes(scored_df['prop_type'])
+
+        avg_stat = self.average_stats(scored_df, codes, stats)
+        raw_edge = self.edges(avg_stat, scored_df['prop_line'])
+
+        # Opportunity rating uses the per-market thresholds; NaN edges never qualify
+        strong = self.row_thresholds('strong_buy', codes)
+        consider = self.row_thresholds('consider', codes)
+        rating = np.select(
+            [raw_edge > strong, raw_edge > consider],
+            ['STRONG BUY', 'CONSIDER'],
+            default='',
+        )
+
+        # Recommendation uses slate-wide cutoffs, treating missing stats as no edge
+        edge = np.nan_to_num(raw_edge, nan=0.0)
+        cutoffs = self.recommendation_thresholds
+        recommendation = np.select(
+            [edge > cutoffs['strong_buy'], edge > cutoffs['consider'], edge < cutoffs['avoid']],
+            ['STRONG BUY', 'CONSIDER', 'AVOID'],
+            default='NEUTRAL',
+        )
+
+        scored_df['avg_stat'] = avg_stat
+        scored_df['edge'] = edge
+        scored_df['rating'] = rating
+        scored_df['recommendation'] = recommendation
+        return scored_df
+
+    def opportunities(self, scored_df):
+        """Rows flagged STRONG BUY or CONSIDER by the per-market thresholds"""
+        return scored_df[scored_df['rating'] != '']
@@ -1,75 +1,81 @@
 # real_prop_scraper.py
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
-import re
+import argparse
+from prop_fetcher import PooledFetcher, combine_props
+from prop_extractor import PropPageExtractor
+
+PROPS_URL = 'https://www.actionnetwork.com/nba/props'
 
 class RealPropScraper:
-    def __init__(self):
+    def __init__(self, urls=None, fetcher=None, save_html=False):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.urls = list(urls or [PROPS_URL])
+        self.fetcher = fetcher or PooledFetcher(headers=self.headers)
+        self.extractor = PropPageExtractor(max_name_texts=50)
+        self.save_html = save_html
     
-    def scrape_action_network_props(self):
-        """Scrape real player props from Action Network"""
+    def scrape_action_network_props(self, urls=None):
+        """Scrape real player props from every configured Action Network page"""
         print("🎯 Scraping player props from Action Network...")
-        url = 'https://www.actionnetwork.com/nba/props'
+        urls = list(urls or self.urls)
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Save the full page for analysis
-            with open('action_network_full.html', 'w', encoding='utf-8') as f:
-                f.write(soup.prettify())
-            print("✅ Full page saved as 'action_network_full.html'")
-            
-            # Let's look for player prop structures
-            prop_data = []
-            
-            # Method 1: Look for tables (common for prop data)
-            tables = soup.find_all('table')
-            print(f"📊 Found {len(tables)} tables on the page")
-            
-            # Method 2: Look for player names and betting lines
-            player_elements = soup.find_all(text=re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+'))
-            unique_players = set()
-            
-            for element in player_elements[:50]:  # Check first 50 matches
-                name = element.strip()
-                if len(name) > 5 and len(name) < 30:
-                    unique_players.add(name)
-            
-            print(f"👤 Found {len(unique_players)} potential players: {list(unique_players)[:10]}...")
-            
-            # Method 3: Extract text and look for prop patterns
-            page_text = soup.get_text()
-            prop_patterns = [
-                r'(\w+ \w+) (OVER|UNDER) (\d+\.\d+)',
-                r'(\w+ \w+) (Points|Rebounds|Assists) (O|U) (\d+\.\d+)',
-            ]
-            
-            for pattern in prop_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    print(f"🎯 Found prop pattern matches: {matches[:3]}...")
+            results = self.fetcher.fetch_all(urls)
+            pages = [result for result in results if result.ok]
+            if not pages:
+                raise RuntimeError(f"all {len(urls)} prop pages failed")
             
-            # For now, let's create some real-looking data from what we found
-            if unique_players:
-                print("\n🔄 Creating real prop data from page content...")
-                # Create realistic props based on actual players found
-                for player in list(unique_players)[:8]:  # Use first 8 players found
-                    prop_data.extend(self.create_realistic_props(player))
+            frames = [self.parse_props_page(page.content, i) for i, page in enumerate(pages)]
+            props_df = combine_props(frames)
             
-            return pd.DataFrame(prop_data) if prop_data else self.get_fallback_props()
+            return props_df if not props_df.empty else self.get_fallback_props()
             
         except Exception as e:
             print(f"❌ Error scraping Action Network: {e}")
             return self.get_fallback_props()
     
+    def parse_props_page(self, content, page_index=0):
+        """Pull player props out of one fetched page"""
+        # Save the raw page for analysis when asked to
+        if self.save_html:
+            filename = 'action_network_full.html' if page_index == 0 else f'action_network_full_{page_index}.html'
+            with open(filename, 'wb') as f:
+                f.write(content)
+            print(f"✅ Full page saved as '{filename}'")
+        
+        # Stream the page, keeping only tables, name-bearing text and embedded state
+        page = self.extractor.extract(content)
+        prop_data = []
+        
+        # Method 1: Look for tables (common for prop data)
+        print(f"📊 Found {page.table_count} tables on the page")
+        
+        # Method 2: Look for player names in text nodes and embedded JSON state
+        unique_players = set(page.state_names)
+        
+        for text in page.name_texts:  # Extractor keeps the first 50 matches
+            name = text.strip()
+            if len(name) > 5 and len(name) < 30:
+                unique_players.add(name)
+        
+        print(f"👤 Found {len(unique_players)} potential players: {list(unique_players)[:10]}...")
+        
+        # Method 3: Look for prop patterns in the page text
+        if page.prop_matches:
+            print(f"🎯 Found prop pattern matches: {page.prop_matches[:3]}...")
+        
+        # For now, let's create some real-looking data from what we found
+        if unique_players:
+            print("\n🔄 Creating real prop data from page content...")
+            # Create realistic props based on actual players found
+            for player in list(unique_players)[:8]:  # Use first 8 players found
+                prop_data.extend(self.create_realistic_props(player))
+        
+        return pd.DataFrame(prop_data)
+    
     def create_realistic_props(self, player_name):
         """Create realistic prop bets based on actual player"""
         props = []
@@ -126,10 +132,15 @@ class RealPropScraper:
 
 def main():
     """Test the real scraper"""
+    parser = argparse.ArgumentParser(description='Scrape NBA player props from Action Network')
+    parser.add_argument('--save-html', action='store_true',
+                        help='write each fetched page to action_network_full*.html')
+    args = parser.parse_args()
+    
     print("🏀 REAL Player Prop Scraper Test")
     print("=" * 50)
     
-    scraper = RealPropScraper()
+    scraper = RealPropScraper(save_html=args.save_html)
     props_df = scraper.scrape_action_network_props()
     
     print(f"\n📊 Successfully gathered {len(props_df)} player prop lines:")
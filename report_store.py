@@ -0,0 +1,154 @@
+# report_store.py
+import os
+import uuid
+from datetime import datetime, date
+
+import numpy as np
+import pandas as pd
+
+from prop_schema import odds_labels
+
+# Columns that belong to the prop line itself or to its scoring; everything else is player-level
+PROP_COLUMNS = ['player_name', 'prop_type', 'prop_line', 'odds', 'sportsbook', 'side']
+SCORE_COLUMNS = ['avg_stat', 'edge', 'rating', 'recommendation',
+                 'over_prob', 'under_prob', 'implied_prob', 'payout', 'expected_value',
+                 'fair_over_prob', 'best_over']
+# Derived for display only; stats, avg_stat and edge stay float64 because backtests rescore from them
+DISPLAY_FLOAT_COLUMNS = ['over_prob', 'under_prob', 'implied_prob', 'payout', 'expected_value', 'fair_over_prob']
+
+DEFAULT_REPORT_DIR = 'reports'
+
+
+def split_report(merged_df, run_at, stats=None):
+    """Split a scored frame into a props table and a one-row-per-player stats table
+
+    With a StatsTable, props carry only a player_id and the stats rows come straight from the table.
+    """
+    prop_columns = [column for column in PROP_COLUMNS + SCORE_COLUMNS if column in merged_df]
+    if stats is not None:
+        props = merged_df[prop_columns].assign(run_at=run_at)
+        return props.reset_index(drop=True), stats.stats_for(merged_df['player_id']).assign(run_at=run_at)
+
+    stat_columns = [column for column in merged_df.columns if column not in prop_columns]
+
+    props = merged_df[prop_columns].assign(run_at=run_at)
+    stats = (merged_df[['player_name'] + stat_columns]
+             .drop_duplicates('player_name')
+             .dropna(subset=stat_columns, how='all')
+             .assign(run_at=run_at))
+    return props.reset_index(drop=True), stats.reset_index(drop=True)
+
+
+def compact_floats(frame):
+    """float64 -> float32 for the display columns: they never need more than ~7 significant digits"""
+    floats = [column for column in DISPLAY_FLOAT_COLUMNS if frame.get(column) is not None
+              and frame[column].dtype == np.float64]
+    return frame.astype({column: np.float32 for column in floats})
+
+
+class CsvReportBackend:
+    """One CSV per run in the working directory, as the tool always did"""
+
+    def __init__(self, directory='.'):
+        self.directory = directory
+
+    def write(self, merged_df, run_at=None, stats=None):
+        run_at = run_at or datetime.now()
+        if stats is not None:
+            merged_df = stats.attach(merged_df)
+        filename = os.path.join(self.directory, f'nba_prop_report_{run_at.strftime("%Y%m%d_%H%M")}.csv')
+        # 6 significant digits: 25.3, not 25.299999999999997
+        merged_df.assign(odds=odds_labels(merged_df['odds'])).to_csv(filename, index=False, float_format='%.6g')
+        print(f"\n💾 Full report exported to: {filename}")
+        return filename
+
+    def describe(self):
+        return 'CSV report generated'
+
+
+class ParquetReportBackend:
+    """Append-only, date-partitioned Parquet tables for props and player stats"""
+
+    def __init__(self, root=DEFAULT_REPORT_DIR, compression='zstd'):
+        self.root = root
+        self.compression = compression
+
+    def partition_dir(self, table, day):
+        return os.path.join(self.root, table, f'date={day.isoformat()}')
+
+    def write_part(self, table, frame, run_at):
+        """Write a new part file atomically; existing files are never touched"""
+        directory = self.partition_dir(table, run_at.date())
+        os.makedirs(directory, exist_ok=True)
+        name = f'part-{run_at.strftime("%H%M%S")}-{uuid.uuid4().hex[:8]}.parquet'
+        path = os.path.join(directory, name)
+        tmp_path = os.path.join(directory, f'.{name}.tmp')
+        compact_floats(frame).to_parquet(tmp_path, index=False, compression=self.compression)
+        os.replace(tmp_path, path)
+        return path
+
+    def write(self, merged_df, run_at=None, stats=None):
+        run_at = run_at or datetime.now()
+        props, stats = split_report(merged_df, run_at, stats)
+
+        # Stats first: a props part only appears once the stats it refers to exist
+        self.write_part('player_stats', stats, run_at)
+        path = self.write_part('props', props, run_at)
+        print(f"\n💾 Report appended: {len(props)} props, {len(stats)} players -> {path}")
+        return path
+
+    def describe(self):
+        return f'Parquet report appended under {self.root}/'
+
+    def partitions(self, table, start=None, end=None):
+        """Partition directories for table whose date falls in [start, end]"""
+        table_dir = os.path.join(self.root, table)
+        if not os.path.isdir(table_dir):
+            return []
+        start = to_date(start) or date.min
+        end = to_date(end) or date.max
+        selected = []
+        for name in sorted(os.listdir(table_dir)):
+            if not name.startswith('date='):
+                continue
+            day = date.fromisoformat(name[len('date='):])
+            if start <= day <= end:
+                selected.append((day, os.path.join(table_dir, name)))
+        return selected
+
+    def read_table(self, table, start=None, end=None):
+        frames = []
+        for day, directory in self.partitions(table, start, end):
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.parquet') and not name.startswith('.'):
+                    frames.append(pd.read_parquet(os.path.join(directory, name)).assign(date=day))
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def load(self, start=None, end=None, with_stats=True):
+        """Props for a date range, optionally re-joined to the stats snapshot of their run"""
+        props = self.read_table('props', start, end)
+        if not with_stats or props.empty:
+            return props
+        stats = self.read_table('player_stats', start, end).drop(columns='date', errors='ignore')
+        if stats.empty:
+            return props
+        return props.merge(stats, on=['run_at', 'player_name'], how='left')
+
+
+def to_date(value):
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value))
+
+
+def make_report_backend(kind, directory=None):
+    """Backend by name, as chosen on the command line"""
+    if kind == 'csv':
+        return CsvReportBackend(directory or '.')
+    if kind == 'parquet':
+        return ParquetReportBackend(directory or DEFAULT_REPORT_DIR)
+    raise ValueError(f"unknown export backend: {kind}")
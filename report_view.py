@@ -0,0 +1,93 @@
+# report_view.py
+# Standard library only: the cached report renders without importing pandas or nba_api
+import json
+import os
+
+SNAPSHOT_NAME = 'last_report.json'
+OPPORTUNITY_FIELDS = ['player_name', 'prop_type', 'prop_line', 'avg_stat', 'edge', 'odds', 'sportsbook',
+                      'over_prob', 'implied_prob', 'expected_value', 'rating']
+MARKET_FIELDS = ['player_name', 'prop_type', 'kind', 'over_line', 'over_odds', 'over_book',
+                 'under_line', 'under_odds', 'under_book']
+RATING = OPPORTUNITY_FIELDS.index('rating')
+
+
+def records(rows, fields):
+    """Snapshot rows are stored as lists in field order; dicts are only built while printing"""
+    return (dict(zip(fields, row)) for row in rows)
+
+
+def print_report(snapshot):
+    """Print the betting report from a snapshot dict (see NBAPropToolFinal.report_snapshot)
+
+    'opportunities' and 'line_shopping' hold rows in OPPORTUNITY_FIELDS / MARKET_FIELDS order.
+    """
+    opportunities = snapshot['opportunities']
+    print("\n" + "="*70)
+    print("🏀 NBA PLAYER PROP BETTING REPORT")
+    print("="*70)
+    print(f"📅 Generated: {snapshot['generated_at']}")
+    print(f"📊 Total Props Analyzed: {snapshot['total_props']}")
+    print(f"🎯 Opportunities Found: {len(opportunities)}")
+    print("="*70)
+
+    # Cross-book middles and arbitrage (only when books quote both sides)
+    markets = snapshot.get('line_shopping', [])
+    if markets:
+        print(f"\n💱 LINE SHOPPING ({len(markets)} markets with a middle or arb):")
+        for market in records(markets, MARKET_FIELDS):
+            print(f"   {market['kind']}: {market['player_name']} {market['prop_type']} | "
+                  f"Over {market['over_line']} ({market['over_odds']}, {market['over_book']}) | "
+                  f"Under {market['under_line']} ({market['under_odds']}, {market['under_book']})")
+
+    if not opportunities:
+        print("\n❌ No strong betting opportunities found today.")
+        print("💡 This is normal - valuable edges are rare!")
+        return
+
+    strong_plays = [row for row in opportunities if row[RATING] == 'STRONG BUY']
+    consider_plays = [row for row in opportunities if row[RATING] == 'CONSIDER']
+
+    if strong_plays:
+        print(f"\n🔥 STRONG BETTING PLAYS ({len(strong_plays)} found):")
+        print("-" * 50)
+        for row in records(strong_plays, OPPORTUNITY_FIELDS):
+            print(f"✅ {row['player_name']} - {row['prop_type'].upper()}")
+            print(f"   📊 Line: {row['prop_line']} | Avg: {row['avg_stat']:.1f} | Edge: +{row['edge']:.1f}")
+            print(f"   🎯 Odds: {row['odds']} | Book: {row['sportsbook']}")
+            print(f"   🎲 Over: {row['over_prob']:.0%} vs implied {row['implied_prob']:.0%} | "
+                  f"EV: {row['expected_value']:+.2f}")
+            print()
+
+    if consider_plays:
+        print(f"\n⚡ CONSIDER THESE PLAYS ({len(consider_plays)} found):")
+        print("-" * 50)
+        for row in records(consider_plays, OPPORTUNITY_FIELDS):
+            print(f"📈 {row['player_name']} - {row['prop_type']}")
+            print(f"   Line: {row['prop_line']} | Avg: {row['avg_stat']:.1f} | Edge: +{row['edge']:.1f}")
+            print(f"   Odds: {row['odds']} | Book: {row['sportsbook']}")
+            print(f"   Over: {row['over_prob']:.0%} vs implied {row['implied_prob']:.0%} | "
+                  f"EV: {row['expected_value']:+.2f}")
+
+
+def snapshot_path(cache_dir):
+    return os.path.join(cache_dir, SNAPSHOT_NAME)
+
+
+def save_snapshot(snapshot, cache_dir):
+    """Write atomically so a concurrent `report` never reads half a file"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = snapshot_path(cache_dir)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(snapshot, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_snapshot(cache_dir):
+    """The last saved report, or None if nothing has been analyzed yet"""
+    path = snapshot_path(cache_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,212 @@
+# season_stats.py
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from stats_cache import StatsCache, DEFAULT_CACHE_DIR
+
+ENDPOINT = 'leagueleaders'
+REGULAR_SEASON = 'Regular Season'
+PLAYOFFS = 'Playoffs'
+NBA_LEAGUE_ID = '00'
+SEASON_KEY = ['league_id', 'season', 'season_type']
+
+# LeagueLeaders totals column -> per-game column
+PER_GAME_COLUMNS = {
+    'PTS': 'ppg',
+    'REB': 'rpg',
+    'AST': 'apg',
+    'STL': 'spg',
+    'BLK': 'bpg',
+    'MIN': 'mpg',
+}
+
+
+def normalize_leaders(raw):
+    """Season totals -> per-game averages, every column divided in one vectorized op"""
+    stats_df = raw[['PLAYER'] + list(PER_GAME_COLUMNS) + ['GP']].copy()
+    stats_df.columns = ['player_name'] + list(PER_GAME_COLUMNS.values()) + ['games_played']
+    per_game = list(PER_GAME_COLUMNS.values())
+    games = stats_df['games_played'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        averages = stats_df[per_game].to_numpy(dtype=float) / games[:, None]
+    stats_df[per_game] = np.where(games[:, None] > 0, averages, np.nan)
+    return stats_df
+
+
+def cache_key(league_id, season, season_type):
+    """Cache entry name; NBA regular season keeps the plain season key used before"""
+    if league_id == NBA_LEAGUE_ID and season_type == REGULAR_SEASON:
+        return season
+    return f'{season}_{season_type}_{league_id}'
+
+
+class FrameLeagueLeaders:
+    """Stand-in for the LeagueLeaders endpoint serving local frames, for offline runs and tests"""
+
+    def __init__(self, frames, latency=0.0):
+        self.frames = frames    # {(season, season_type) or (league_id, season, season_type): totals frame}
+        self.latency = latency
+        self.calls = 0
+
+    def __call__(self, league_id=NBA_LEAGUE_ID, season=None, season_type_all_star=REGULAR_SEASON, **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        frame = self.frames.get((league_id, season, season_type_all_star),
+                                self.frames.get((season, season_type_all_star)))
+        if frame is None:
+            raise LookupError(f'no {season_type_all_star} totals for {season} (league {league_id})')
+        return FrameEndpointResult(frame)
+
+
+class FrameEndpointResult:
+    def __init__(self, frame):
+        self.frame = frame
+
+    def get_data_frames(self):
+        return [self.frame]
+
+
+class SeasonStats:
+    """Per-game stats for many seasons, kept on disk as memory-mapped Arrow files and read on demand"""
+
+    def __init__(self, parts):
+        self.parts = parts      # {(league_id, season, season_type): path to an uncompressed Arrow file}
+
+    def __len__(self):
+        return len(self.parts)
+
+    def keys(self):
+        return sorted(self.parts)
+
+    def table(self, key, columns=None):
+        """Zero-copy Arrow view of one season: pages are only read when touched"""
+        return feather.read_table(self.parts[key], columns=columns, memory_map=True)
+
+    def get(self, season, season_type=REGULAR_SEASON, league_id=NBA_LEAGUE_ID, columns=None):
+        """One season as a plain stats frame, shaped like get_player_stats()"""
+        return self.table((league_id, season, season_type), columns).to_pandas()
+
+    def frame(self, columns=None, seasons=None, season_types=None):
+        """Season-indexed frame (league_id, season, season_type, player_name) for the selected parts"""
+        if columns is not None:
+            columns = ['player_name'] + [column for column in columns if column != 'player_name']
+        frames = []
+        for key in self.keys():
+            league_id, season, season_type = key
+            if seasons is not None and season not in seasons:
+                continue
+            if season_types is not None and season_type not in season_types:
+                continue
+            part = self.table(key, columns).to_pandas()
+            part.insert(0, 'season_type', season_type)
+            part.insert(0, 'season', season)
+            part.insert(0, 'league_id', league_id)
+            frames.append(part)
+        if not frames:
+            return pd.DataFrame(columns=SEASON_KEY + ['player_name']).set_index(SEASON_KEY + ['player_name'])
+        return pd.concat(frames, ignore_index=True).set_index(SEASON_KEY + ['player_name'])
+
+
+class SeasonStatsLoader:
+    """Fetch or read from cache many (season, season type) stats concurrently on a bounded pool"""
+
+    def __init__(self, stats_cache=None, league_leaders=None, max_workers=4):
+        self.stats_cache = stats_cache or StatsCache()
+        self.league_leaders = league_leaders    # None: nba_api's LeagueLeaders, see endpoint()
+        self.max_workers = max_workers
+        self.parts_dir = os.path.join(self.stats_cache.cache_dir, 'season_stats')
+        self.failures = {}
+
+    def endpoint(self):
+        """The injected endpoint, else nba_api's LeagueLeaders (imported only when a fetch is needed)"""
+        if self.league_leaders is None:
+            from nba_api.stats.endpoints import leagueleaders
+            self.league_leaders = leagueleaders.LeagueLeaders
+        return self.league_leaders
+
+    def part_path(self, key):
+        name = cache_key(*key).replace(' ', '_')
+        return os.path.join(self.parts_dir, f'{ENDPOINT}_{name}.arrow')
+
+    def part_is_current(self, key):
+        """A fresh cache entry whose normalized part was written after it needs no reread"""
+        cache = self.stats_cache
+        path = self.part_path(key)
+        age = cache.age(ENDPOINT, cache_key(*key))
+        if age is None or not os.path.exists(path) or not (cache.offline or age <= cache.ttl_seconds):
+            return False
+        if os.path.getmtime(path) < os.path.getmtime(cache.path_for(ENDPOINT, cache_key(*key))):
+            return False
+        cache.record('hit', ENDPOINT, cache_key(*key), age)
+        return True
+
+    def load_one(self, key):
+        """Raw totals through the cache, normalized and written as an uncompressed (mappable) Arrow file"""
+        if self.part_is_current(key):
+            return self.part_path(key)
+        league_id, season, season_type = key
+        raw = self.stats_cache.get(
+            ENDPOINT, cache_key(*key),
+            lambda: self.endpoint()(league_id=league_id, season=season,
+                                    season_type_all_star=season_type).get_data_frames()[0],
+        )
+        stats_df = normalize_leaders(raw)
+        path = self.part_path(key)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        feather.write_feather(pa.Table.from_pandas(stats_df, preserve_index=False), tmp_path,
+                              compression='uncompressed')
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, seasons, season_types=(REGULAR_SEASON,), league_ids=(NBA_LEAGUE_ID,)):
+        """Every (league, season, season type) combination; failed ones are reported and skipped"""
+        keys = [(league_id, season, season_type)
+                for league_id in league_ids for season in seasons for season_type in season_types]
+        os.makedirs(self.parts_dir, exist_ok=True)
+        print(f"📊 Loading stats for {len(keys)} season/type combinations on {self.max_workers} workers...")
+        start = time.perf_counter()
+
+        parts, self.failures = {}, {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(keys)))) as pool:
+            futures = {key: pool.submit(self.load_one, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    parts[key] = future.result()
+                except Exception as e:
+                    self.failures[key] = e
+                    print(f"❌ Error loading {key[1]} {key[2]}: {e}")
+
+        print(f"✅ Loaded {len(parts)}/{len(keys)} in {time.perf_counter() - start:.2f}s")
+        return SeasonStats(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load per-game stats for several seasons and season types')
+    parser.add_argument('seasons', nargs='+', help='e.g. 2022-23 2023-24 2024-25')
+    parser.add_argument('--playoffs', action='store_true', help='also load playoff stats')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    parser.add_argument('--offline', action='store_true')
+    args = parser.parse_args()
+
+    season_types = (REGULAR_SEASON, PLAYOFFS) if args.playoffs else (REGULAR_SEASON,)
+    loader = SeasonStatsLoader(StatsCache(cache_dir=args.cache_dir, offline=args.offline), max_workers=args.workers)
+    stats = loader.load(args.seasons, season_types)
+    if not len(stats):
+        return
+    summary = stats.frame(columns=['ppg', 'mpg']).groupby(level=SEASON_KEY).agg(
+        players=('ppg', 'size'), ppg=('ppg', 'mean'), mpg=('mpg', 'mean'))
+    print(summary.to_string(float_format='{:.1f}'.format))
+
+
+if __name__ == "__main__":
+    main()
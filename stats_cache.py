@@ -0,0 +1,133 @@
+# stats_cache.py
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+DEFAULT_CACHE_DIR = '.nba_stats_cache'
+DEFAULT_TTL_SECONDS = 12 * 60 * 60        # season totals change at most once a night
+DEFAULT_STALE_SECONDS = 7 * 24 * 60 * 60  # serve stale data this long while refreshing
+
+
+class StatsCache:
+    """Feather-backed cache of NBA API frames keyed by endpoint and season"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 stale_seconds=DEFAULT_STALE_SECONDS, offline=False):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.offline = offline
+        self.counts = {'hit': 0, 'stale': 0, 'miss': 0}
+        self._refreshing = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, endpoint, season):
+        """File holding one cached frame"""
+        key = re.sub(r'[^A-Za-z0-9_.-]', '_', f'{endpoint}_{season}')
+        return os.path.join(self.cache_dir, f'{key}.feather')
+
+    def age(self, endpoint, season):
+        """Seconds since the entry was written, or None if it is not cached"""
+        path = self.path_for(endpoint, season)
+        if not os.path.exists(path):
+            return None
+        return time.time() - os.path.getmtime(path)
+
+    def read(self, endpoint, season):
+        return pd.read_feather(self.path_for(endpoint, season))
+
+    def write(self, endpoint, season, frame):
+        """Write atomically so readers never see a half-written file"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(endpoint, season)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        # Convert explicitly: DataFrame.to_feather relies on pyarrow's lazily initialized pandas check,
+        # which can misfire when the first writes in a process come from several threads at once
+        feather.write_feather(pa.Table.from_pandas(frame.reset_index(drop=True), preserve_index=False), tmp_path)
+        os.replace(tmp_path, path)
+
+    def get(self, endpoint, season, fetch):
+        """Return the cached frame, calling fetch() on a miss or in the background when stale"""
+        age = self.age(endpoint, season)
+
+        if age is not None and (self.offline or age <= self.ttl_seconds):
+            self.record('hit', endpoint, season, age)
+            return self.read(endpoint, season)
+
+        if self.offline:
+            self.record('miss', endpoint, season, age)
+            raise LookupError(f'{endpoint} {season} is not cached and offline mode is on')
+
+        if age is not None and age <= self.ttl_seconds + self.stale_seconds:
+            self.record('stale', endpoint, season, age)
+            self.revalidate(endpoint, season, fetch)
+            return self.read(endpoint, season)
+
+        self.record('miss', endpoint, season, age)
+        frame = fetch()
+        self.write(endpoint, season, frame)
+        return frame
+
+    def revalidate(self, endpoint, season, fetch):
+        """Refresh an entry on a worker thread; at most one refresh per key"""
+        key = (endpoint, season)
+        with self._lock:
+            if key in self._refreshing and self._refreshing[key].is_alive():
+                return
+            # Non-daemon so a one-shot run still finishes writing before exit
+            worker = threading.Thread(target=self._refresh, args=(endpoint, season, fetch))
+            self._refreshing[key] = worker
+        worker.start()
+
+    def _refresh(self, endpoint, season, fetch):
+        try:
+            self.write(endpoint, season, fetch())
+        except Exception as e:
+            print(f"⚠️ Background refresh of {endpoint} {season} failed: {e}")
+
+    def wait(self, timeout=None):
+        """Block until background refreshes are done"""
+        for worker in list(self._refreshing.values()):
+            worker.join(timeout)
+
+    def record(self, outcome, endpoint, season, age):
+        # Season loads record from pool threads; an unlocked += can drop a count
+        with self._lock:
+            self.counts[outcome] += 1
+        age_text = 'never cached' if age is None else f'age {format_age(age)}'
+        print(f"🗄️ Stats cache {outcome.upper()}: {endpoint} {season} ({age_text})")
+
+    def entries(self):
+        """(file name, age in seconds) for everything in the cache directory"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        now = time.time()
+        return sorted(
+            (name, now - os.path.getmtime(os.path.join(self.cache_dir, name)))
+            for name in os.listdir(self.cache_dir)
+            if name.endswith('.feather')
+        )
+
+    def report(self):
+        """Print the cache state at startup"""
+        mode = 'offline' if self.offline else f'TTL {format_age(self.ttl_seconds)}'
+        entries = self.entries()
+        print(f"🗄️ Stats cache: {self.cache_dir} ({mode}, {len(entries)} entries)")
+        for name, age in entries:
+            state = 'fresh' if age <= self.ttl_seconds else 'stale'
+            print(f"   • {name}: {format_age(age)} old ({state})")
+
+
+def format_age(seconds):
+    if seconds < 60:
+        return f'{seconds:.0f}s'
+    if seconds < 3600:
+        return f'{seconds / 60:.0f}m'
+    if seconds < 86400:
+        return f'{seconds / 3600:.1f}h'
+    return f'{seconds / 86400:.1f}d'
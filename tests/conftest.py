@@ -0,0 +1,29 @@
+# tests/conftest.py
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Modules live at the repository root, as the benchmarks import them
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def totals_frame(players, scale=1.0):
+    """LeagueLeaders-shaped season totals for {name: games played}; per game: 20*scale points, 5*scale rebounds..."""
+    games = pd.Series(players, dtype=float).to_numpy()
+    return pd.DataFrame({
+        'PLAYER': list(players),
+        'PTS': games * 20 * scale,
+        'REB': games * 5 * scale,
+        'AST': games * 4 * scale,
+        'STL': games * scale,
+        'BLK': games * 0.5 * scale,
+        'MIN': games * 30 * scale,
+        'GP': games,
+    })
+
+
+@pytest.fixture
+def make_totals():
+    return totals_frame
@@ -0,0 +1,74 @@
+# tests/test_backtest.py
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import Backtester
+from game_log_store import FrameGameLogSource, GameLogStore
+from nba_prop_tool import NBAPropToolFinal
+from report_store import ParquetReportBackend
+from stats_cache import StatsCache
+
+# Averages that sit on a threshold: 39/5 - 7.5 is the 0.3 rebounds cutoff, 57/10 - 5.5 the 0.2 assists one
+STATS = pd.DataFrame({
+    'player_name': ['Josh Hart', 'Mike Conley', 'Nikola Jokic', 'Stephen Curry'],
+    'ppg': [9.6, 11.2, 26.8, 28.5],
+    'rpg': [39 / 5, 2.9, 12.3, 4.5],
+    'apg': [5.1, 57 / 10, 9.2, 5.2],
+    'games_played': [5, 10, 17, 18],
+})
+PROPS = pd.DataFrame({
+    'player_name': ['Josh Hart', 'Mike Conley', 'Nikola Jokic', 'Nikola Jokic', 'Stephen Curry'],
+    'prop_type': ['Rebounds', 'Assists', 'Rebounds', 'Assists', 'Points'],
+    'prop_line': [7.5, 5.5, 11.5, 8.5, 27.5],
+    'odds': ['-110', '+105', '-115', '+120', '-110'],
+    'sportsbook': ['FanDuel', 'DraftKings', 'BetMGM', 'FanDuel', 'DraftKings'],
+})
+# The box score each prop settles on, as (pts, reb, ast)
+BOX_SCORES = {'Josh Hart': (10, 9, 4), 'Mike Conley': (12, 3, 7), 'Nikola Jokic': (30, 14, 8),
+              'Stephen Curry': (31, 5, 6)}
+
+
+def box_score_logs(day):
+    rows = [{'PLAYER_NAME': name, 'GAME_ID': f'00224{i:05d}', 'GAME_DATE': day.isoformat(), 'MIN': 34.0,
+             'PTS': pts, 'REB': reb, 'AST': ast, 'STL': 1, 'BLK': 0}
+            for i, (name, (pts, reb, ast)) in enumerate(BOX_SCORES.items())]
+    return pd.DataFrame(rows)
+
+
+def float32_parts(backend, table):
+    """Rewrite a table's parts the way older exports stored them: every float column as float32"""
+    for _, directory in backend.partitions(table):
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            frame = pd.read_parquet(path)
+            floats = frame.select_dtypes(include='float64').columns
+            frame.astype({column: np.float32 for column in floats}).to_parquet(path, index=False)
+
+
+@pytest.mark.parametrize('stored_as', ['float64', 'float32'])
+def test_replay_rates_props_as_the_live_run_did(tmp_path, stored_as):
+    backend = ParquetReportBackend(root=tmp_path / 'reports')
+    tool = NBAPropToolFinal(stats_cache=StatsCache(cache_dir=str(tmp_path / 'cache')), report_backend=backend)
+    _, scored_df = tool.analyze_opportunities(PROPS, STATS)
+    tool.export_results(scored_df, tool.scoring_engine.opportunities(scored_df))
+    if stored_as == 'float32':
+        float32_parts(backend, 'player_stats')
+        float32_parts(backend, 'props')
+
+    (day, _), = backend.partitions('props')
+    game_log_store = GameLogStore(db_path=str(tmp_path / 'game_logs.sqlite'),
+                                  source=FrameGameLogSource(box_score_logs(day)))
+    game_log_store.sync()
+    settled = Backtester(backend, game_log_store).settled_props()
+
+    key = ['player_name', 'prop_type']
+    live = scored_df.assign(rating=scored_df['rating'].replace('', 'NONE')).set_index(key)['rating']
+    replayed = settled.set_index(key)['rating']
+    assert len(settled) == len(PROPS)
+    assert replayed.sort_index().astype(str).to_dict() == live.sort_index().astype(str).to_dict()
+    # The threshold rows are not bets either way
+    assert replayed[('Josh Hart', 'Rebounds')] == 'NONE'
+    assert replayed[('Mike Conley', 'Assists')] == 'NONE'
@@ -0,0 +1,57 @@
+# tests/test_name_resolver.py
+import json
+
+import pandas as pd
+
+from name_resolver import PlayerNameResolver, normalize_name
+
+OKC = ['Jaylin Williams', 'Shai Gilgeous-Alexander', 'Giannis Antetokounmpo', 'Luka Dončić', 'Jabari Smith Jr.',
+       'Jalen Smith']
+
+
+def test_normalize_name_folds_accents_suffixes_and_punctuation():
+    assert normalize_name('Luka Dončić Jr.') == 'luka doncic'
+    assert normalize_name("De'Aaron Fox") == 'deaaron fox'
+    assert normalize_name(None) == ''
+
+
+def test_normalized_exact_and_typo_resolve():
+    resolver = PlayerNameResolver(OKC)
+    assert resolver.resolve('Luka Doncic') == 'Luka Dončić'
+    assert resolver.resolve('Jabari Smith') == 'Jabari Smith Jr.'
+    assert resolver.resolve('Giannes Antetokounmpo') == 'Giannis Antetokounmpo'
+    assert resolver.counts == {'exact': 2, 'fuzzy': 1, 'memo': 0, 'miss': 0}
+
+
+def test_different_player_with_same_surname_is_not_joined(tmp_path):
+    memo_path = tmp_path / 'name_memo.json'
+    resolver = PlayerNameResolver(OKC, memo_path=str(memo_path))
+    resolved = resolver.resolve_series(pd.Series(['Jalen Williams']))
+    assert resolved.isna().all()
+    assert not memo_path.exists()
+
+
+def test_memo_is_written_only_when_a_fuzzy_match_adds_to_it(tmp_path):
+    memo_path = tmp_path / 'name_memo.json'
+    PlayerNameResolver(OKC, memo_path=str(memo_path)).resolve_series(pd.Series(['Shai Gilgeous-Alexander']))
+    assert not memo_path.exists()
+
+    PlayerNameResolver(OKC, memo_path=str(memo_path)).resolve_series(pd.Series(['Giannes Antetokounmpo']))
+    assert json.loads(memo_path.read_text()) == {'Giannes Antetokounmpo': 'Giannis Antetokounmpo'}
+    assert [path.name for path in tmp_path.iterdir()] == ['name_memo.json']
+
+
+def test_ambiguous_initial_is_a_miss_and_not_memoized():
+    resolver = PlayerNameResolver(OKC)
+    assert resolver.resolve('J. Smith') is None
+    assert resolver.memo == {}
+
+
+def test_normalized_index_beats_a_bad_memo_entry(tmp_path):
+    memo_path = tmp_path / 'name_memo.json'
+    memo_path.write_text(json.dumps({'JALEN SMITH': 'Jalan Smith', 'Jalen Williams': 'Jaylin Williams'}))
+    resolver = PlayerNameResolver(OKC + ['Jalan Smith'], memo_path=str(memo_path))
+    assert resolver.resolve('JALEN SMITH') == 'Jalen Smith'
+    assert resolver.counts['memo'] == 0
+    # Entries that fail the same-player check are dropped when the memo loads
+    assert 'Jalen Williams' not in resolver.memo
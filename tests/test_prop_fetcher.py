@@ -0,0 +1,144 @@
+# tests/test_prop_fetcher.py
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from nba_prop_tool import NBAPropToolFinal
+from prop_fetcher import PooledFetcher, combine_props
+from stats_cache import StatsCache
+
+PAGES = {
+    '/props/east': '<html><body><div class="prop">LeBron James</div><div class="prop">Stephen Curry</div>'
+                   '</body></html>',
+    '/props/west': '<html><body><div class="prop">LeBron James</div><div class="prop">Nikola Jokic</div>'
+                   '</body></html>',
+}
+
+
+class PropSite(ThreadingHTTPServer):
+    """Local stand-in for the props site: canned pages, scripted failures, concurrency tracking"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), PropSiteHandler)
+        self.failures = {}      # path -> statuses to send before the page, e.g. [503, 503]
+        self.delay = 0.0
+        self.hits = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def url(self, path, host='127.0.0.1'):
+        return f'http://{host}:{self.server_address[1]}{path}'
+
+
+class PropSiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        site = self.server
+        with site.lock:
+            site.hits[self.path] = site.hits.get(self.path, 0) + 1
+            site.in_flight += 1
+            site.max_in_flight = max(site.max_in_flight, site.in_flight)
+            pending = site.failures.get(self.path, [])
+            status = pending.pop(0) if pending else 200
+        try:
+            time.sleep(site.delay)
+            body = PAGES.get(self.path, '<html><body>ok</body></html>').encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with site.lock:
+                site.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = PropSite()
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_per_host_are_capped(site):
+    site.delay = 0.05
+    fetcher = PooledFetcher(max_per_host=2, max_workers=8, backoff=0)
+    results = fetcher.fetch_all([site.url(f'/page/{i}') for i in range(8)])
+
+    assert all(result.ok for result in results)
+    assert site.max_in_flight == 2
+    assert fetcher.counters() == {'http_requests': 8, 'http_bytes': sum(r.bytes for r in results),
+                                  'http_retries': 0}
+
+
+def test_limits_are_per_host(site):
+    site.delay = 0.05
+    fetcher = PooledFetcher(max_per_host=1, max_workers=8, backoff=0)
+    # Same server under two host names: each gets its own limit
+    urls = [site.url(f'/page/{i}', host=host) for i in range(3) for host in ('127.0.0.1', 'localhost')]
+    results = fetcher.fetch_all(urls)
+
+    assert all(result.ok for result in results)
+    assert site.max_in_flight == 2
+
+
+@pytest.mark.parametrize('status', [503, 429])
+def test_retryable_status_is_retried(site, status):
+    site.failures['/props/east'] = [status, status]
+    result = PooledFetcher(retries=3, backoff=0).fetch(site.url('/props/east'))
+
+    assert result.ok
+    assert result.attempts == 3
+    assert site.hits['/props/east'] == 3
+    assert b'LeBron James' in result.content
+
+
+def test_retries_run_out(site):
+    site.failures['/busy'] = [503] * 5
+    fetcher = PooledFetcher(retries=2, backoff=0)
+    result = fetcher.fetch(site.url('/busy'))
+
+    assert not result.ok
+    assert result.status == 503
+    assert result.error == 'HTTP 503'
+    assert result.attempts == 3
+    assert fetcher.counters()['http_retries'] == 2
+
+
+def test_not_found_is_not_retried(site):
+    site.failures['/gone'] = [404]
+    result = PooledFetcher(retries=3, backoff=0).fetch(site.url('/gone'))
+
+    assert not result.ok
+    assert result.attempts == 1
+
+
+def test_pages_are_combined_without_duplicate_lines(site, tmp_path):
+    site.failures['/props/west'] = [503]
+    tool = NBAPropToolFinal(stats_cache=StatsCache(cache_dir=str(tmp_path)),
+                            prop_urls=[site.url('/props/east'), site.url('/props/west')],
+                            fetcher=PooledFetcher(backoff=0))
+    props_df = tool.get_player_props()
+
+    assert tool.props_source == 'scraped'
+    assert sorted(props_df['player_name'].unique()) == ['LeBron James', 'Nikola Jokic', 'Stephen Curry']
+    # LeBron is on both pages; his three lines are kept once
+    assert len(props_df) == 9
+    assert not props_df.duplicated(['player_name', 'prop_type', 'prop_line', 'sportsbook']).any()
+
+
+def test_combine_props_of_nothing_is_an_empty_frame():
+    combined = combine_props([None])
+
+    assert combined.empty
+    assert list(combined.columns) == ['player_name', 'prop_type', 'prop_line', 'odds', 'sportsbook']
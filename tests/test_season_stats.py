@@ -0,0 +1,116 @@
+# tests/test_season_stats.py
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from season_stats import (FrameLeagueLeaders, SeasonStatsLoader, normalize_leaders, SEASON_KEY, NBA_LEAGUE_ID,
+                          REGULAR_SEASON, PLAYOFFS)
+from stats_cache import StatsCache
+
+SEASONS = ['2022-23', '2023-24']
+
+
+class CountingLeagueLeaders(FrameLeagueLeaders):
+    """Fake endpoint that also records how many calls were in flight at once"""
+
+    def __init__(self, frames, latency=0.0):
+        super().__init__(frames, latency)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super().__call__(**kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def frames(make_totals):
+    return {
+        (season, season_type): make_totals({'Luka Doncic': 10, 'Nikola Jokic': 20},
+                                           scale=1.0 if season_type == REGULAR_SEASON else 1.5)
+        for season in SEASONS for season_type in (REGULAR_SEASON, PLAYOFFS)
+    }
+
+
+def make_loader(cache_dir, endpoint, max_workers=4):
+    return SeasonStatsLoader(StatsCache(cache_dir=str(cache_dir)), league_leaders=endpoint, max_workers=max_workers)
+
+
+def test_cold_load_fetches_every_combination_concurrently(tmp_path, frames):
+    endpoint = CountingLeagueLeaders(frames, latency=0.05)
+    stats = make_loader(tmp_path, endpoint).load(SEASONS, (REGULAR_SEASON, PLAYOFFS))
+
+    assert len(stats) == 4
+    assert endpoint.calls == 4
+    assert endpoint.max_in_flight > 1
+    assert all(os.path.exists(path) for path in stats.parts.values())
+    assert stats.get('2023-24', PLAYOFFS).set_index('player_name')['ppg'].to_dict() == {
+        'Luka Doncic': 30.0, 'Nikola Jokic': 30.0}
+
+
+def test_warm_load_skips_the_endpoint(tmp_path, frames):
+    endpoint = CountingLeagueLeaders(frames)
+    make_loader(tmp_path, endpoint).load(SEASONS)
+    loader = make_loader(tmp_path, endpoint)
+    stats = loader.load(SEASONS)
+
+    assert endpoint.calls == 2
+    assert loader.stats_cache.counts == {'hit': 2, 'stale': 0, 'miss': 0}
+    assert len(stats) == 2
+
+
+def test_refreshed_cache_entry_is_normalized_again(tmp_path, frames, make_totals):
+    endpoint = CountingLeagueLeaders(frames)
+    loader = make_loader(tmp_path, endpoint)
+    key = (NBA_LEAGUE_ID, '2023-24', REGULAR_SEASON)
+    loader.load(['2023-24'])
+
+    # Raw totals refreshed after the part was written (e.g. by get_player_stats)
+    then = time.time() - 10
+    os.utime(loader.part_path(key), (then, then))
+    loader.stats_cache.write('leagueleaders', '2023-24', make_totals({'Luka Doncic': 10}, scale=3.0))
+    stats = loader.load(['2023-24'])
+
+    assert endpoint.calls == 1
+    assert stats.get('2023-24')['ppg'].tolist() == [60.0]
+
+
+def test_zero_games_played_gives_nan_averages(make_totals):
+    stats_df = normalize_leaders(make_totals({'Luka Doncic': 10, 'Two-Way Player': 0}))
+    two_way = stats_df.set_index('player_name').loc['Two-Way Player']
+
+    assert two_way[['ppg', 'rpg', 'apg', 'spg', 'bpg', 'mpg']].isna().all()
+    assert two_way['games_played'] == 0
+
+
+def test_failed_combination_is_reported_and_skipped(tmp_path, frames):
+    endpoint = CountingLeagueLeaders(frames)
+    loader = make_loader(tmp_path, endpoint)
+    stats = loader.load(SEASONS + ['1999-00'])
+
+    assert len(stats) == 2
+    assert list(loader.failures) == [(NBA_LEAGUE_ID, '1999-00', REGULAR_SEASON)]
+
+
+def test_frame_is_indexed_by_season_key_and_player(tmp_path, frames):
+    stats = make_loader(tmp_path, CountingLeagueLeaders(frames)).load(SEASONS, (REGULAR_SEASON, PLAYOFFS))
+    frame = stats.frame(columns=['ppg'])
+
+    assert list(frame.index.names) == SEASON_KEY + ['player_name']
+    assert list(frame.columns) == ['ppg']
+    assert len(frame) == 8
+    assert frame.loc[(NBA_LEAGUE_ID, '2022-23', PLAYOFFS, 'Nikola Jokic'), 'ppg'] == 30.0
+
+    regular = stats.frame(columns=['ppg'], seasons=['2023-24'], season_types=[REGULAR_SEASON])
+    assert np.allclose(regular['ppg'], 20.0)
+    assert regular.index.get_level_values('season').unique().tolist() == ['2023-24']
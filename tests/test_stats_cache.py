@@ -0,0 +1,95 @@
+# tests/test_stats_cache.py
+import os
+import time
+
+import pytest
+
+from nba_prop_tool import NBAPropToolFinal
+from season_stats import FrameLeagueLeaders, REGULAR_SEASON
+from stats_cache import StatsCache
+
+SEASON = '2024-25'
+TTL = 60
+STALE = 600
+
+
+@pytest.fixture
+def league_leaders(make_totals):
+    return FrameLeagueLeaders({(SEASON, REGULAR_SEASON): make_totals({'Luka Doncic': 10, 'Nikola Jokic': 20})})
+
+
+def make_tool(cache_dir, league_leaders, offline=False):
+    stats_cache = StatsCache(cache_dir=str(cache_dir), ttl_seconds=TTL, stale_seconds=STALE, offline=offline)
+    return NBAPropToolFinal(stats_cache=stats_cache, league_leaders=league_leaders, offline=offline)
+
+
+def age_entry(stats_cache, seconds):
+    path = stats_cache.path_for('leagueleaders', SEASON)
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_miss_fetches_once_then_hits(tmp_path, league_leaders):
+    tool = make_tool(tmp_path, league_leaders)
+
+    stats_df = tool.get_player_stats(SEASON)
+    assert league_leaders.calls == 1
+    assert stats_df.set_index('player_name')['ppg'].to_dict() == {'Luka Doncic': 20.0, 'Nikola Jokic': 20.0}
+
+    again = tool.get_player_stats(SEASON)
+    assert league_leaders.calls == 1
+    assert tool.stats_cache.counts == {'hit': 1, 'stale': 0, 'miss': 1}
+    assert again.equals(stats_df)
+
+
+def test_stale_entry_is_served_while_revalidating(tmp_path, league_leaders, make_totals):
+    tool = make_tool(tmp_path, league_leaders)
+    tool.get_player_stats(SEASON)
+    age_entry(tool.stats_cache, TTL + 5)
+    league_leaders.frames[(SEASON, REGULAR_SEASON)] = make_totals({'Luka Doncic': 10}, scale=2.0)
+
+    served = tool.get_player_stats(SEASON)
+    tool.stats_cache.wait()
+
+    assert tool.stats_cache.counts['stale'] == 1
+    assert len(served) == 2    # the old entry, returned without waiting on the fetch
+    assert league_leaders.calls == 2
+    refreshed = tool.get_player_stats(SEASON)
+    assert refreshed.set_index('player_name')['ppg'].to_dict() == {'Luka Doncic': 40.0}
+    assert tool.stats_cache.counts['hit'] == 1
+
+
+def test_entry_past_the_stale_window_is_refetched(tmp_path, league_leaders, make_totals):
+    tool = make_tool(tmp_path, league_leaders)
+    tool.get_player_stats(SEASON)
+    age_entry(tool.stats_cache, TTL + STALE + 5)
+    league_leaders.frames[(SEASON, REGULAR_SEASON)] = make_totals({'Luka Doncic': 10}, scale=2.0)
+
+    stats_df = tool.get_player_stats(SEASON)
+
+    assert tool.stats_cache.counts == {'hit': 0, 'stale': 0, 'miss': 2}
+    assert stats_df['ppg'].tolist() == [40.0]
+
+
+def test_offline_miss_never_calls_the_endpoint(tmp_path, league_leaders):
+    tool = make_tool(tmp_path, league_leaders, offline=True)
+
+    with pytest.raises(LookupError):
+        tool.stats_cache.get('leagueleaders', SEASON, lambda: pytest.fail('fetched while offline'))
+    # The tool falls back to its sample stats rather than failing the run
+    stats_df = tool.get_player_stats(SEASON)
+
+    assert league_leaders.calls == 0
+    assert stats_df.equals(tool.get_sample_stats())
+
+
+def test_offline_serves_an_expired_entry(tmp_path, league_leaders):
+    make_tool(tmp_path, league_leaders).get_player_stats(SEASON)
+    tool = make_tool(tmp_path, league_leaders, offline=True)
+    age_entry(tool.stats_cache, TTL + STALE + 5)
+
+    stats_df = tool.get_player_stats(SEASON)
+
+    assert league_leaders.calls == 1
+    assert tool.stats_cache.counts['hit'] == 1
+    assert len(stats_df) == 2